@@ -14,45 +14,280 @@ call client.messages.create(), and get back a response with
 .content[0].text (the text) and .usage (token counts).
 """
 
+import asyncio
+import functools
+import hashlib
 import json
+import threading
+from dataclasses import dataclass
+from typing import Callable
 import anthropic
-from config import app_config, get_api_key
+import httpx
+import msgspec
+
+# orjson parses the (often 8K-token) responses several times faster than
+# the stdlib. Its JSONDecodeError subclasses json.JSONDecodeError, so the
+# except clause below works with either.
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    _json_loads = json.loads
+
+from config import ModelConfig, app_config, get_api_key
 from token_tracker import TokenTracker
+import schemas
 from prompts import (
     SCENARIO_SYSTEM_PROMPT,
     get_scenario_user_prompt,
     REVIEW_SYSTEM_PROMPT,
     get_review_user_prompt,
-    IMPROVEMENT_SYSTEM_PROMPT,
-    get_improvement_user_prompt,
+    REVIEW_WITH_COMPARISON_SYSTEM_PROMPT,
+    get_review_with_comparison_prompt,
     CHECKLIST_REVIEW_SYSTEM_PROMPT,
     get_checklist_review_prompt,
+    CHECKLISTS_REVIEW_SYSTEM_PROMPT,
+    get_checklists_review_prompt,
     QUICK_SCENARIO_SYSTEM_PROMPT,
     get_quick_scenario_user_prompt,
     QUICK_GRADE_SYSTEM_PROMPT,
     get_quick_grade_user_prompt,
+    JSON_REPAIR_SYSTEM_PROMPT,
+    get_json_repair_prompt,
 )
 
 
-def _get_client() -> anthropic.Anthropic:
+# HTTP/2 lets concurrent calls share one TLS
+# connection instead of opening a socket each. Requires the h2 package
+# (httpx[http2] in requirements.txt). The SDK's Default*HttpxClient
+# classes keep its usual timeouts and redirect handling.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+
+# One client per API key, created on first use and reused afterwards
+_ASYNC_CLIENT_CACHE: dict[str, anthropic.AsyncAnthropic] = {}
+
+# Max concurrent in-flight calls (_call_claude_async)
+_MAX_CONCURRENT_CALLS = 5
+_CALL_SEMAPHORE = asyncio.Semaphore(_MAX_CONCURRENT_CALLS)
+
+# Tracker updates and the response cache are only touched from the event
+# loop today, but they're plain shared state; the locks are uncontended
+# there and keep them correct if a call is ever made from a worker thread
+# (asyncio.to_thread, a script). This one keeps updates to a shared
+# tracker's running totals from interleaving.
+_TRACK_LOCK = threading.Lock()
+
+
+def _get_async_client() -> anthropic.AsyncAnthropic:
     """
-    Create an Anthropic client instance.
-    
-    WHY CREATE FRESH EACH TIME:
-    The client is lightweight and stateless. Creating it fresh
-    ensures we always use the current API key (in case it changes).
-    For a high-traffic app you'd reuse it, but for personal use
-    this is simpler and more robust.
+    Return the Anthropic client for the current API key.
+
+    WHY REUSE THE CLIENT:
+    Each client owns an HTTP connection pool. Creating a fresh one per
+    call means a new TCP + TLS handshake (~100ms) on every request.
+    Reusing it keeps connections alive between calls. Keying the cache
+    by API key means a rotated key still gets a fresh client.
     """
-    return anthropic.Anthropic(api_key=get_api_key())
+    key = get_api_key()
+    client = _ASYNC_CLIENT_CACHE.get(key)
+    if client is None:
+        client = anthropic.AsyncAnthropic(
+            api_key=key,
+            http_client=anthropic.DefaultAsyncHttpxClient(http2=True, limits=_HTTP_LIMITS),
+        )
+        _ASYNC_CLIENT_CACHE[key] = client
+    return client
 
 
-def _call_claude(
+def _check_budget(tracker: TokenTracker) -> None:
+    """Raise ValueError if this session has already hit its cost limit."""
+    current_cost = tracker.accumulated_cost
+    if current_cost >= app_config.cost_limit:
+        # The message is only formatted on this (rare) path
+        raise ValueError(
+            f"Cost limit reached: ${current_cost:.2f} >= ${app_config.cost_limit:.2f}. "
+            f"Increase cost_limit in settings to continue."
+        )
+
+
+# ──────────────────────────────────────────────
+# Exact-match response cache
+# ──────────────────────────────────────────────
+# WHY ONLY SOME CALLS:
+# Scenario generation must NOT be cached — a fresh exercise every time
+# is the whole point. Grading calls are different: the same checklist
+# sent twice (double-click, retry after a network blip) should get the
+# same answer, and there's no reason to pay for it twice.
+#
+# Keys are a hash of everything that affects the answer. The dict keeps
+# insertion order, so evicting the first key drops the oldest entry.
+#
+# Results are stored as encoded JSON and decoded afresh on every hit.
+# Handing out the stored dict itself would let a caller that edits its
+# result change the answer every later hit gets.
+
+_RESPONSE_CACHE: dict[str, bytes] = {}
+_RESPONSE_CACHE_SIZE = 256
+# See _TRACK_LOCK. Without it, two threads filling the cache could evict
+# the same key, or one could iterate the dict while another changes it.
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _cache_key(
+    model_name: str, max_tokens: int, system_prompt: str, user_prompt: str | list[dict]
+) -> str:
+    if not isinstance(user_prompt, str):
+        user_prompt = "".join(block["text"] for block in user_prompt)
+    raw = f"{model_name}|{max_tokens}|{system_prompt}|{user_prompt}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _cache_get(
+    key: str, tracker: TokenTracker, model: ModelConfig, call_label: str
+) -> dict | None:
+    """Return a cached result, recording the hit as a zero-token call."""
+    with _RESPONSE_CACHE_LOCK:
+        encoded = _RESPONSE_CACHE.get(key)
+    if encoded is None:
+        return None
+    with _TRACK_LOCK:
+        tracker.track(
+            model=model, input_tokens=0, output_tokens=0,
+            call_label=f"{call_label} (cached)",
+        )
+    return _json_loads(encoded)
+
+
+def _cache_put(key: str, result: dict) -> None:
+    """Store a successful result; parse failures are never cached."""
+    if "error" in result:
+        return
+    # Encoded now, before the caller gets a chance to change result
+    encoded = msgspec.json.encode(result)
+    with _RESPONSE_CACHE_LOCK:
+        if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_SIZE:
+            del _RESPONSE_CACHE[next(iter(_RESPONSE_CACHE))]
+        _RESPONSE_CACHE[key] = encoded
+
+
+@functools.lru_cache(maxsize=None)
+def _system_blocks(system_prompt: str, ttl: str | None = None) -> list[dict]:
+    """
+    Wrap a system prompt as a cacheable content block.
+
+    WHY PROMPT CACHING:
+    Our system prompts never change between calls. Marking them with
+    cache_control lets Anthropic keep the processed prefix for ~5 min;
+    repeat calls read it at 0.1x the input price (the first write costs
+    1.25x) and skip re-processing it, so they start faster too.
+
+    ttl="1h" keeps it for an hour instead, at 2x input for the write.
+    Worth it only for a prompt that's reused at intervals longer than
+    5 minutes — the scenario prompt, which runs once per session.
+
+    Prompts below the model's minimum cacheable length (1024 tokens;
+    2048 on Haiku) are simply not cached — the marker is harmless.
+
+    WHY lru_cache:
+    There are only six system prompts, so each block list is built once
+    and the same object is handed to every call after that. (Python
+    caches a string's hash, so the lookup doesn't rescan the prompt.)
+    Callers must not mutate the returned list.
+    """
+    cache_control = {"type": "ephemeral"}
+    if ttl is not None:
+        cache_control["ttl"] = ttl
+    return [{"type": "text", "text": system_prompt, "cache_control": cache_control}]
+
+
+def _json_span(text: str) -> str:
+    """
+    Return the part of text from the first '{' or '[' to the last '}' or ']'.
+
+    Anything outside that span (fences, preamble, trailing newlines) is
+    dropped. If there are no brackets, text is returned unchanged so the
+    parser reports a normal error.
+    """
+    obj_start = text.find("{")
+    arr_start = text.find("[")
+    if obj_start < 0 or (0 <= arr_start < obj_start):
+        start = arr_start
+    else:
+        start = obj_start
+    end = max(text.rfind("}"), text.rfind("]")) + 1
+    if start < 0 or end <= start:
+        return text
+    return text[start:end]
+
+
+def _parse_response(
+    response,
+    tracker: TokenTracker,
+    model: ModelConfig,
+    call_label: str,
+    schema: type | None = None,
+) -> dict:
+    """
+    Record token usage for a response and parse its text as JSON.
+
+    Shared by the sync and async call paths — everything after the
+    HTTP round-trip is identical between them.
+
+    When a schema (from schemas.py) is given, msgspec parses and checks
+    the shape in the same pass; a mismatch is reported the same way as
+    invalid JSON.
+    """
+    # Track token usage from the response
+    # response.usage has .input_tokens and .output_tokens, plus the
+    # prompt-cache counts (None when caching didn't apply)
+    usage = response.usage
+    # Split of the cache write by TTL; absent when nothing was written
+    cache_creation = getattr(usage, "cache_creation", None)
+    with _TRACK_LOCK:
+        tracker.track(
+            model=model,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            call_label=call_label,
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", None) or 0,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", None) or 0,
+            cache_write_1h_tokens=getattr(cache_creation, "ephemeral_1h_input_tokens", None) or 0,
+        )
+
+    # Extract text from response
+    # response.content is a list of content blocks; we want the text one
+    raw_text = response.content[0].text
+
+    # Parse JSON — Claude sometimes wraps in ```json fences (or adds a
+    # preamble) despite instructions. Rather than stripping those, we
+    # find where the JSON starts and ends and slice it out in one step.
+    cleaned = _json_span(raw_text)
+
+    try:
+        if schema is not None:
+            return msgspec.json.decode(cleaned, type=schema)
+        return _json_loads(cleaned)
+    except (json.JSONDecodeError, msgspec.DecodeError) as e:
+        # If JSON parsing fails, return the raw text in a wrapper
+        # so the caller can still display something useful
+        return {
+            "error": "Failed to parse JSON response",
+            "raw_response": raw_text,
+            "parse_error": str(e),
+            # "max_tokens" means the JSON was cut off — not repairable
+            "stop_reason": getattr(response, "stop_reason", None),
+        }
+
+
+async def _call_claude_async(
     system_prompt: str,
-    user_prompt: str,
+    user_prompt: str | list[dict],
     tracker: TokenTracker,
     call_label: str,
     max_tokens: int = 8192,
+    stream: bool = False,
+    cache: bool = False,
+    schema: type | None = None,
+    cache_ttl: str | None = None,
 ) -> dict:
     """
     Make a single Claude API call and return parsed JSON.
@@ -64,69 +299,351 @@ def _call_claude(
     
     Args:
         system_prompt: The system message (instructions for Claude)
-        user_prompt: The user message (what we want Claude to do)
+        user_prompt: The user message (what we want Claude to do) — a
+            string, or content blocks when part of it should be cached
         tracker: TokenTracker to record usage
         call_label: Human name for this call (for cost display)
         max_tokens: Maximum output tokens (default 8192)
+        stream: Receive the response as a stream of events (see below)
+        cache: Reuse the result of an identical earlier call, if any
+        schema: Expected response shape from schemas.py (optional)
+        cache_ttl: Prompt-cache TTL for the system prompt (see _system_blocks)
     
     Returns:
         Parsed JSON as a Python dict
     
     Raises:
-        ValueError: If Claude's response isn't valid JSON
+        ValueError: If the session's cost limit has been reached
         anthropic.APIError: If the API call fails
+
+    WHY STREAM LONG RESPONSES:
+    A non-streaming request sits idle until Claude has written every
+    token, then ships one big body. Streaming assembles the message as
+    tokens arrive, so nothing times out on a slow 8K-token generation
+    and the final text is ready the moment the last event lands.
+    The end result (text + usage) is the same Message object either way.
+
+    WHY ASYNC:
+    Claude calls are pure network wait. With the async client, the
+    event loop can serve other requests (or run other Claude calls)
+    while this one is in flight. The semaphore caps how many calls
+    run at once so a big batch doesn't trip Anthropic's rate limits.
     """
-    client = _get_client()
+    client = _get_async_client()
     model = app_config.model
 
-    # Check cost budget before making the call
-    current_cost = tracker.estimate_cost(model)
-    if current_cost >= app_config.cost_limit:
-        raise ValueError(
-            f"Cost limit reached: ${current_cost:.2f} >= ${app_config.cost_limit:.2f}. "
-            f"Increase cost_limit in settings to continue."
-        )
+    if cache:
+        key = _cache_key(model.api_name, max_tokens, system_prompt, user_prompt)
+        cached = _cache_get(key, tracker, model, call_label)
+        if cached is not None:
+            return cached
+
+    _check_budget(tracker)
 
-    response = client.messages.create(
+    request = dict(
         model=model.api_name,
         max_tokens=max_tokens,
-        system=system_prompt,
+        system=_system_blocks(system_prompt, cache_ttl),
         messages=[{"role": "user", "content": user_prompt}],
     )
+    async with _CALL_SEMAPHORE:
+        if stream:
+            async with client.messages.stream(**request) as message_stream:
+                response = await message_stream.get_final_message()
+        else:
+            response = await client.messages.create(**request)
+    result = _parse_response(response, tracker, model, call_label, schema)
+    if cache:
+        _cache_put(key, result)
+    return result
 
-    # Track token usage from the response
-    # response.usage has .input_tokens and .output_tokens
-    tracker.track(
-        input_tokens=response.usage.input_tokens,
-        output_tokens=response.usage.output_tokens,
-        call_label=call_label,
+
+# ──────────────────────────────────────────────
+# CALL REGISTRY
+# ──────────────────────────────────────────────
+# WHY A TABLE:
+# Every Claude call in this app is the same shape — a fixed system
+# prompt, a user prompt built from some arguments, a label, a token
+# budget, and an expected response schema. Writing those down as data
+# means one dispatch function (run_async) handles all of them.
+
+@dataclass(frozen=True, slots=True)
+class CallSpec:
+    """Everything needed to make one kind of Claude call."""
+    system: str                  # System prompt (static)
+    build: Callable[..., str | list[dict]]  # Builds the user prompt from kwargs
+    label: str                   # Label for cost tracking
+    max_tokens: int
+    schema: type                 # Expected response shape (schemas.py)
+    stream: bool = False         # Stream the response (long outputs)
+    cache: bool = False          # Reuse identical earlier results
+    cache_ttl: str | None = None  # System-prompt cache TTL ("1h"), default 5 min
+
+
+CALLS: dict[str, CallSpec] = {
+    "scenario": CallSpec(
+        SCENARIO_SYSTEM_PROMPT, get_scenario_user_prompt, "scenario_generation",
+        max_tokens=8192, schema=schemas.ScenarioResponse, stream=True,  # Scenarios can be long
+        cache_ttl="1h",  # Runs once per session — often more than 5 min apart
+    ),
+    "review": CallSpec(
+        REVIEW_SYSTEM_PROMPT, get_review_user_prompt, "review",
+        max_tokens=4096, schema=schemas.ReviewResponse, stream=True,
+    ),
+    "review_with_comparison": CallSpec(
+        REVIEW_WITH_COMPARISON_SYSTEM_PROMPT, get_review_with_comparison_prompt,
+        "review_with_comparison",
+        max_tokens=5120, schema=schemas.ReviewWithComparisonResponse, stream=True,
+    ),
+    "checklist": CallSpec(
+        CHECKLIST_REVIEW_SYSTEM_PROMPT, get_checklist_review_prompt, "checklist_review",
+        max_tokens=1024, schema=schemas.ChecklistReviewResponse, cache=True,
+    ),
+    "checklists": CallSpec(
+        CHECKLISTS_REVIEW_SYSTEM_PROMPT, get_checklists_review_prompt, "checklists_review",
+        max_tokens=3072, schema=schemas.ChecklistReviewsResponse, cache=True,
+    ),
+    "quick_scenario": CallSpec(
+        QUICK_SCENARIO_SYSTEM_PROMPT, get_quick_scenario_user_prompt, "quick_scenario",
+        max_tokens=2048, schema=schemas.QuickScenarioResponse,
+    ),
+    "quick_grade": CallSpec(
+        QUICK_GRADE_SYSTEM_PROMPT, get_quick_grade_user_prompt, "quick_grade",
+        max_tokens=1024, schema=schemas.QuickGradeResponse, cache=True,
+    ),
+}
+
+
+async def run_async(name: str, tracker: TokenTracker, **kwargs) -> dict:
+    """Make the Claude call registered as `name`; kwargs go to its prompt builder."""
+    spec = CALLS[name]
+    result = await _call_claude_async(
+        system_prompt=spec.system,
+        user_prompt=spec.build(**kwargs),
+        tracker=tracker,
+        call_label=spec.label,
+        max_tokens=spec.max_tokens,
+        stream=spec.stream,
+        cache=spec.cache,
+        schema=spec.schema,
+        cache_ttl=spec.cache_ttl,
     )
+    return await _repair_async(spec, result, tracker)
 
-    # Extract text from response
-    # response.content is a list of content blocks; we want the text one
-    raw_text = response.content[0].text
 
-    # Parse JSON — Claude sometimes wraps in ```json fences despite instructions
-    cleaned = raw_text.strip()
-    if cleaned.startswith("```"):
-        # Remove markdown code fence
-        cleaned = cleaned.split("\n", 1)[1]  # Remove first line (```json)
-        cleaned = cleaned.rsplit("```", 1)[0]  # Remove last fence
-        cleaned = cleaned.strip()
+# ──────────────────────────────────────────────
+# JSON repair
+# ──────────────────────────────────────────────
+# WHY REPAIR INSTEAD OF BIGGER WARNINGS:
+# Nearly every response parses. Rather than spelling out every way the
+# JSON could go wrong in every system prompt (paid for on every call),
+# a response that fails to parse or to match its schema gets one small
+# follow-up call: the broken text plus msgspec's error message, e.g.
+# "Object missing required field `summary` - at `$.overall`".
+# If the repair fails too, the original error is returned as before.
+
+def _repairable(result: dict) -> bool:
+    """True for a parse failure that a repair call could plausibly fix."""
+    return (
+        "parse_error" in result
+        and "raw_response" in result
+        and result.get("stop_reason") != "max_tokens"  # Truncated, not malformed
+    )
+
+
+def _repair_args(spec: CallSpec, failed: dict, tracker: TokenTracker) -> dict:
+    """_call_claude_async arguments for repairing `failed`, a result of `spec`."""
+    return dict(
+        system_prompt=JSON_REPAIR_SYSTEM_PROMPT,
+        user_prompt=get_json_repair_prompt(failed["raw_response"], failed["parse_error"]),
+        tracker=tracker,
+        call_label=f"{spec.label}_repair",
+        max_tokens=spec.max_tokens,
+        stream=spec.stream,
+        schema=spec.schema,
+    )
+
+
+async def _repair_async(spec: CallSpec, result: dict, tracker: TokenTracker) -> dict:
+    """result, or the repaired version of it if it failed to parse."""
+    if not _repairable(result):
+        return result
+    repaired = await _call_claude_async(**_repair_args(spec, result, tracker))
+    return result if "parse_error" in repaired else repaired
+
+
+async def stream_async(name: str, tracker: TokenTracker, **kwargs):
+    """
+    Like run_async(), but yields the response text as it arrives.
+
+    Yields ("text", chunk) for every piece of text Claude sends, then
+    a single ("result", parsed dict) once the message is complete —
+    the same dict run_async() would have returned.
+
+    WHY:
+    The review takes 10-30 seconds to write. Passing the text along
+    as it's generated lets the UI show progress instead of a spinner.
+    Results from this path are never cached — it's only used for
+    calls where a fresh answer is the point.
+    """
+    spec = CALLS[name]
+    client = _get_async_client()
+    model = app_config.model
+
+    _check_budget(tracker)
 
+    request = dict(
+        model=model.api_name,
+        max_tokens=spec.max_tokens,
+        system=_system_blocks(spec.system, spec.cache_ttl),
+        messages=[{"role": "user", "content": spec.build(**kwargs)}],
+    )
+    # WHY A QUEUE:
+    # The semaphore permit must cover only the upstream request. Yielding
+    # while holding it would keep a permit for as long as the SSE client
+    # takes to read (or, if it disconnected, until this generator is
+    # garbage-collected) — five slow clients would block every Claude
+    # call in the process. So a task reads the stream into a queue under
+    # the permit, and this generator yields from the queue outside it.
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump():
+        try:
+            async with _CALL_SEMAPHORE:
+                async with client.messages.stream(**request) as message_stream:
+                    async for text in message_stream.text_stream:
+                        queue.put_nowait(("text", text))
+                    queue.put_nowait(("done", await message_stream.get_final_message()))
+        except Exception as e:
+            queue.put_nowait(("error", e))
+
+    producer = asyncio.create_task(pump())
     try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError as e:
-        # If JSON parsing fails, return the raw text in a wrapper
-        # so the caller can still display something useful
-        return {
-            "error": "Failed to parse JSON response",
-            "raw_response": raw_text,
-            "parse_error": str(e),
-        }
+        while True:
+            kind, value = await queue.get()
+            if kind == "text":
+                yield "text", value
+            elif kind == "error":
+                raise value
+            else:
+                response = value
+                break
+    finally:
+        # Stops the upstream request if the consumer went away early;
+        # a no-op once the stream has finished
+        producer.cancel()
+    result = _parse_response(response, tracker, model, spec.label, spec.schema)
+    yield "result", await _repair_async(spec, result, tracker)
+
+
+class _TopLevelSections:
+    """
+    Picks completed top-level entries out of a JSON object as it streams in.
+
+    feed() takes the next chunk of text and returns the (key, value)
+    pairs whose values closed in that chunk. Only object and array
+    values are reported — that's every top-level field of a scenario.
+
+    WHY NOT A FULL INCREMENTAL PARSER:
+    We only need to know when each top-level value ends. Tracking
+    nesting depth, whether we're inside a string, and whether the outer
+    object expects a key or a value next is enough for that; the
+    finished value is then parsed in one go with _json_loads.
+    Anything before the opening brace (a stray ```json fence) is skipped.
+
+    WHY A LIST OF CHUNKS:
+    A scenario's documents array can be most of the response, arriving
+    in hundreds of small chunks. Appending to one string would copy the
+    whole pending value on every chunk. Instead each chunk is scanned
+    once on its own, positions are kept as absolute offsets into the
+    stream, and the chunks are joined only when a key or value closes.
+    """
 
+    __slots__ = (
+        "_parts", "_base", "_end", "_depth", "_in_string", "_escaped",
+        "_expect_key", "_key", "_key_start", "_value_start",
+    )
 
-def generate_scenario(tracker: TokenTracker) -> dict:
+    def __init__(self):
+        self._parts: list[str] = []  # Chunks still needed, from offset _base
+        self._base = 0               # Stream offset of _parts[0]
+        self._end = 0                # Stream offset just past the last chunk
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._expect_key = False     # In the outer object, after { or ,
+        self._key = None
+        self._key_start = -1         # Stream offsets; -1 when nothing is pending
+        self._value_start = -1
+
+    def _slice(self, start: int, end: int) -> str:
+        """Stream text from offset start up to (not including) end."""
+        return "".join(self._parts)[start - self._base:end - self._base]
+
+    def feed(self, chunk: str) -> list[tuple[str, object]]:
+        self._parts.append(chunk)
+        offset = self._end
+        self._end += len(chunk)
+        done = []
+        for j, char in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key_start >= 0:
+                        self._key = _json_loads(self._slice(self._key_start, offset + j + 1))
+                        self._key_start = -1
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._key_start = offset + j
+            elif char in "{[":
+                if self._depth == 1 and not self._expect_key:
+                    self._value_start = offset + j
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect_key = True  # The outer object opened
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1 and self._value_start >= 0:
+                    try:
+                        done.append((self._key, _json_loads(
+                            self._slice(self._value_start, offset + j + 1)
+                        )))
+                    except json.JSONDecodeError:
+                        pass  # Malformed — the final parse will report it
+                    self._value_start = -1
+            elif self._depth == 1:
+                if char == ":":
+                    self._expect_key = False
+                elif char == ",":
+                    self._expect_key = True
+        # Keep only the chunks a pending key or value still needs
+        pending = max(self._key_start, self._value_start)
+        if pending < 0:
+            self._parts.clear()
+            self._base = self._end
+        elif pending >= offset and len(self._parts) > 1:
+            self._parts[:] = [chunk]
+            self._base = offset
+        return done
+
+
+def _scenario_prompt_args() -> dict:
+    """Prompt-builder arguments for a full scenario, from current settings."""
+    return {
+        "domain": app_config.domain,
+        "difficulty": app_config.difficulty,
+        "timer_request": app_config.timer_request,
+        "timer_document": app_config.timer_document,
+        "timer_data": app_config.timer_data,
+    }
+
+
+async def generate_scenario_async(tracker: TokenTracker) -> dict:
     """
     Generate a complete training scenario.
 
@@ -143,22 +660,29 @@ def generate_scenario(tracker: TokenTracker) -> dict:
     Content length scales with timer settings — shorter timers
     produce shorter documents and data sets.
     """
-    return _call_claude(
-        system_prompt=SCENARIO_SYSTEM_PROMPT,
-        user_prompt=get_scenario_user_prompt(
-            domain=app_config.domain,
-            difficulty=app_config.difficulty,
-            timer_request=app_config.timer_request,
-            timer_document=app_config.timer_document,
-            timer_data=app_config.timer_data,
-        ),
-        tracker=tracker,
-        call_label="scenario_generation",
-        max_tokens=8192,  # Scenarios can be long
-    )
+    return await run_async("scenario", tracker, **_scenario_prompt_args())
+
+
+async def generate_scenario_stream(tracker: TokenTracker):
+    """
+    Streaming version of generate_scenario_async().
+
+    Yields ("section", (key, value)) each time a top-level field of the
+    scenario ("background", "request", ...) is complete, then
+    ("result", scenario) with the validated whole — the same dict
+    generate_scenario_async() returns. Sections are unvalidated previews;
+    only the result should be stored.
+    """
+    sections = _TopLevelSections()
+    async for kind, value in stream_async("scenario", tracker, **_scenario_prompt_args()):
+        if kind == "text":
+            for section in sections.feed(value):
+                yield "section", section
+        else:
+            yield kind, value
 
 
-def generate_review(
+async def generate_review_async(
     scenario: dict, user_responses: dict, tracker: TokenTracker
 ) -> dict:
     """
@@ -173,34 +697,65 @@ def generate_review(
     one starts fresh. So we must re-send the rubric so Claude knows
     what the "right answers" are.
     """
-    return _call_claude(
-        system_prompt=REVIEW_SYSTEM_PROMPT,
-        user_prompt=get_review_user_prompt(scenario, user_responses),
-        tracker=tracker,
-        call_label="review",
-        max_tokens=4096,
-    )
+    return await run_async("review", tracker, scenario=scenario, user_responses=user_responses)
+
+
+def generate_review_stream(scenario: dict, user_responses: dict, tracker: TokenTracker):
+    """Streaming version of generate_review_async() — see stream_async()."""
+    return stream_async("review", tracker, scenario=scenario, user_responses=user_responses)
 
 
-def generate_improvement_comparison(
-    past_summaries: list[dict], current_feedback: dict, tracker: TokenTracker
+async def generate_review_and_comparison_async(
+    scenario: dict, user_responses: dict, past_summaries: list[dict], tracker: TokenTracker
 ) -> dict:
     """
-    Compare current session to past sessions (optional API call #3).
+    Review the session and compare it to past sessions in one call.
 
-    Only called when there are previous sessions to compare against.
-    Uses less tokens because we only send summaries, not full sessions.
+    Used instead of generate_review_async() when there are past
+    sessions. Returns {"feedback": ..., "improvement": ...};
+    if the response can't be parsed, "feedback" holds the usual error
+    dict and "improvement" is None.
     """
-    return _call_claude(
-        system_prompt=IMPROVEMENT_SYSTEM_PROMPT,
-        user_prompt=get_improvement_user_prompt(past_summaries, current_feedback),
-        tracker=tracker,
-        call_label="improvement_comparison",
-        max_tokens=1024,
-    )
-
+    return _split_review_and_comparison(await run_async(
+        "review_with_comparison", tracker,
+        scenario=scenario, user_responses=user_responses, past_summaries=past_summaries,
+    ))
+
+
+async def generate_review_and_comparison_stream(
+    scenario: dict, user_responses: dict, past_summaries: list[dict], tracker: TokenTracker
+):
+    """Streaming version of generate_review_and_comparison_async() — see stream_async()."""
+    async for kind, value in stream_async(
+        "review_with_comparison", tracker,
+        scenario=scenario, user_responses=user_responses, past_summaries=past_summaries,
+    ):
+        if kind == "result":
+            value = _split_review_and_comparison(value)
+        yield kind, value
+
+
+def _split_review_and_comparison(result: dict) -> dict:
+    """
+    Split a combined response into {"feedback": ..., "improvement": ...}.
 
-def review_checklist(
+    A parse error belongs to the feedback; there's no comparison without
+    it. The comparison itself is best-effort, as it was when it was a
+    separate call: if Claude left it out or got its shape wrong, the
+    user still gets their feedback, just with improvement=None.
+    """
+    if "error" in result:
+        return {"feedback": result, "improvement": None}
+    improvement = result.get("improvement")
+    if improvement is not None:
+        try:
+            improvement = msgspec.convert(improvement, schemas.ImprovementResponse)
+        except msgspec.ValidationError:
+            improvement = None
+    return {"feedback": result["feedback"], "improvement": improvement}
+
+
+async def review_checklist_async(
     document: dict,
     checklist: list[dict],
     rubric_key_concepts: list[str],
@@ -212,12 +767,33 @@ def review_checklist(
     Called after each document step to give immediate feedback on
     what parameters/thresholds were captured vs. missed.
     """
-    return _call_claude(
-        system_prompt=CHECKLIST_REVIEW_SYSTEM_PROMPT,
-        user_prompt=get_checklist_review_prompt(document, checklist, rubric_key_concepts),
-        tracker=tracker,
-        call_label="checklist_review",
-        max_tokens=1024,
+    return await run_async(
+        "checklist", tracker,
+        document=document, checklist=checklist, rubric_key_concepts=rubric_key_concepts,
+    )
+
+
+async def review_checklists_all_async(
+    documents: list[dict],
+    checklists: list[list[dict]],
+    rubric_key_concepts: list[list[str]],
+    tracker: TokenTracker,
+) -> dict:
+    """
+    Review several documents' checklists in ONE Claude call.
+
+    Returns {"reviews": [...]} with one review per document, in order
+    (or the usual {"error": ...} wrapper if parsing fails).
+
+    WHY ONE CALL INSTEAD OF ONE PER DOCUMENT:
+    Separate calls, even concurrent ones, pay for N requests — N round
+    trips and N copies of the system prompt. Folding the documents into
+    one prompt pays for each of those once. The tradeoff is that nothing comes
+    back until every document has been reviewed.
+    """
+    return await run_async(
+        "checklists", tracker,
+        documents=documents, checklists=checklists, rubric_key_concepts=rubric_key_concepts,
     )
 
 
@@ -225,7 +801,9 @@ def review_checklist(
 # QUICK PRACTICE FUNCTIONS
 # ──────────────────────────────────────────────
 
-def generate_quick_scenario(duration_mode: str, domain: str | None, tracker: TokenTracker) -> dict:
+async def generate_quick_scenario_async(
+    duration_mode: str, domain: str | None, tracker: TokenTracker
+) -> dict:
     """
     Generate a quick practice scenario with bullet points.
 
@@ -234,16 +812,10 @@ def generate_quick_scenario(duration_mode: str, domain: str | None, tracker: Tok
         domain: Engineering domain or None for random
         tracker: Token tracker
     """
-    return _call_claude(
-        system_prompt=QUICK_SCENARIO_SYSTEM_PROMPT,
-        user_prompt=get_quick_scenario_user_prompt(duration_mode, domain),
-        tracker=tracker,
-        call_label="quick_scenario",
-        max_tokens=2048,
-    )
+    return await run_async("quick_scenario", tracker, duration_mode=duration_mode, domain=domain)
 
 
-def grade_quick_response(
+async def grade_quick_response_async(
     question: str,
     documents: list[dict],
     key_facts: list[str],
@@ -254,12 +826,11 @@ def grade_quick_response(
     """
     Grade a quick practice response.
     """
-    return _call_claude(
-        system_prompt=QUICK_GRADE_SYSTEM_PROMPT,
-        user_prompt=get_quick_grade_user_prompt(
-            question, documents, key_facts, ideal_response, user_response
-        ),
-        tracker=tracker,
-        call_label="quick_grade",
-        max_tokens=1024,
+    return await run_async(
+        "quick_grade", tracker,
+        question=question,
+        documents=documents,
+        key_facts=key_facts,
+        ideal_response=ideal_response,
+        user_response=user_response,
     )
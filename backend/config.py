@@ -8,12 +8,13 @@ the model, adjust timers, or update pricing without hunting through
 multiple files.
 """
 
+import functools
 import os
 from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """
     Holds info about a Claude model — its API name and pricing.
@@ -22,11 +23,39 @@ class ModelConfig:
     dataclass auto-generates __init__, __repr__, etc. from the fields.
     It's Python's way of saying "this is just a container for data"
     without writing boilerplate. Think of it like a struct in C.
+
+    WHY frozen AND slots:
+    Pricing never changes at runtime, so frozen=True makes accidental
+    edits an error. slots=True stores fields in fixed slots instead of
+    a per-instance __dict__ — smaller objects and faster attribute
+    reads, which happen on every API call and cost estimate.
     """
     api_name: str           # e.g. "claude-opus-4-6"
     display_name: str       # e.g. "Opus 4.6" (for the UI)
     input_cost_per_m: float   # dollars per 1M input tokens
     output_cost_per_m: float  # dollars per 1M output tokens
+    # Prompt caching: writing a prefix to the cache costs 1.25x input
+    # (2x with the 1-hour TTL), reading it back costs 0.1x input
+    cache_write_cost_per_m: float  # dollars per 1M cache-creation tokens (5 min TTL)
+    cache_read_cost_per_m: float   # dollars per 1M cache-read tokens
+    cache_write_1h_cost_per_m: float  # dollars per 1M cache-creation tokens (1 hour TTL)
+
+    # Same prices per single token, filled in by __post_init__ so the
+    # per-call cost update multiplies instead of dividing by 1M each time
+    input_cost_per_tok: float = field(init=False, repr=False)
+    output_cost_per_tok: float = field(init=False, repr=False)
+    cache_write_cost_per_tok: float = field(init=False, repr=False)
+    cache_read_cost_per_tok: float = field(init=False, repr=False)
+    cache_write_1h_cost_per_tok: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # frozen=True blocks normal assignment, even here, so go through
+        # object.__setattr__ (the documented escape hatch for this case)
+        object.__setattr__(self, "input_cost_per_tok", self.input_cost_per_m * 1e-6)
+        object.__setattr__(self, "output_cost_per_tok", self.output_cost_per_m * 1e-6)
+        object.__setattr__(self, "cache_write_cost_per_tok", self.cache_write_cost_per_m * 1e-6)
+        object.__setattr__(self, "cache_read_cost_per_tok", self.cache_read_cost_per_m * 1e-6)
+        object.__setattr__(self, "cache_write_1h_cost_per_tok", self.cache_write_1h_cost_per_m * 1e-6)
 
 
 # Available models — add new ones here as they release
@@ -36,23 +65,32 @@ MODELS = {
         display_name="Opus 4.6",
         input_cost_per_m=15.0,
         output_cost_per_m=75.0,
+        cache_write_cost_per_m=18.75,
+        cache_read_cost_per_m=1.50,
+        cache_write_1h_cost_per_m=30.0,
     ),
     "sonnet": ModelConfig(
         api_name="claude-sonnet-4-5-20250929",
         display_name="Sonnet 4.5",
         input_cost_per_m=3.0,
         output_cost_per_m=15.0,
+        cache_write_cost_per_m=3.75,
+        cache_read_cost_per_m=0.30,
+        cache_write_1h_cost_per_m=6.0,
     ),
     "haiku": ModelConfig(
         api_name="claude-haiku-4-5-20251001",
         display_name="Haiku 4.5",
         input_cost_per_m=0.80,
         output_cost_per_m=4.0,
+        cache_write_cost_per_m=1.00,
+        cache_read_cost_per_m=0.08,
+        cache_write_1h_cost_per_m=1.60,
     ),
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """
     All runtime settings for the app.
@@ -60,6 +98,9 @@ class AppConfig:
     WHY DEFAULTS HERE:
     These are sensible starting values. The user can change them
     via the settings modal in the UI, which calls PATCH /api/config.
+
+    Not frozen (PATCH /api/config mutates it in place), but slotted
+    like ModelConfig.
     """
     # Which model to use (key into MODELS dict)
     model_key: str = "opus"
@@ -79,12 +120,31 @@ class AppConfig:
     # Difficulty level
     difficulty: str = "intermediate"  # beginner, intermediate, advanced
 
-    @property
-    def model(self) -> ModelConfig:
-        """Look up the full ModelConfig from the key."""
-        return MODELS[self.model_key]
+    # The full ModelConfig for model_key. Resolved once here instead of a
+    # MODELS lookup on every access — it's read on every API call.
+    # Always change the model through set_model_key() so the two stay
+    # in sync.
+    model: ModelConfig = field(init=False, repr=False)
+
+    # Bumped by PATCH /api/config after every change. Anything derived
+    # from these settings (e.g. the GET /api/config response) can be
+    # cached and rebuilt only when this moves.
+    version: int = field(default=0, init=False, repr=False)
 
+    def __post_init__(self):
+        self.model = MODELS[self.model_key]
 
+    def set_model_key(self, model_key: str):
+        """Switch models. Raises ValueError for an unknown key."""
+        if model_key not in MODELS:
+            raise ValueError(
+                f"Unknown model '{model_key}'. Must be one of: {list(MODELS)}"
+            )
+        self.model_key = model_key
+        self.model = MODELS[model_key]
+
+
+@functools.lru_cache(maxsize=1)
 def get_api_key() -> str:
     """
     Read the Anthropic API key from environment.
@@ -93,6 +153,10 @@ def get_api_key() -> str:
     API keys should NEVER be in source code. If you push code to GitHub
     with a key in it, bots will find it within minutes and abuse it.
     We read from the .env file (loaded by the server) or environment.
+
+    The result is cached after the first successful read (a missing key
+    raises and is not cached). If you rotate the key in the environment
+    at runtime, call get_api_key.cache_clear().
     """
     key = os.environ.get("ANTHROPIC_API_KEY", "")
     if not key:
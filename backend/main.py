@@ -10,40 +10,53 @@ FastAPI is a modern Python web framework that:
 
 HOW THIS SERVER WORKS:
 The server manages "sessions" — each session is one training exercise.
-Sessions are stored in memory (active_sessions dict) while in progress,
+Sessions are stored in memory (active_sessions) while in progress,
 and saved to JSON files when complete.
 
 The frontend calls these endpoints in order:
   1. POST /api/session/start → generates scenario, returns session_id + request
+     (or POST /api/session/start/stream → same, streamed as SSE)
   2. GET /api/session/{id}/doc/{n} → returns document n (revealed one at a time)
   3. GET /api/session/{id}/data → returns the data artifact
   4. POST /api/session/{id}/submit → saves user notes for a step
   5. POST /api/session/{id}/review → triggers AI review + saves everything
+     (or POST /api/session/{id}/review/stream → same, streamed as SSE)
   6. GET /api/session/{id} → gets full session (for viewing history)
   7. GET /api/sessions → lists all past sessions
 """
 
+import asyncio
 import os
+from dataclasses import dataclass, field
+
+import orjson
 from datetime import datetime
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+from typing_extensions import TypedDict  # pydantic needs this one before 3.12
 from pathlib import Path
 from typing import Optional
 
 from config import app_config, MODELS
 from claude_client import (
-    generate_scenario,
-    generate_review,
-    generate_improvement_comparison,
-    review_checklist,
-    generate_quick_scenario,
-    grade_quick_response,
+    generate_scenario_async,
+    generate_scenario_stream,
+    generate_review_async,
+    generate_review_stream,
+    generate_review_and_comparison_async,
+    generate_review_and_comparison_stream,
+    review_checklist_async,
+    review_checklists_all_async,
+    generate_quick_scenario_async,
+    grade_quick_response_async,
 )
 from token_tracker import TokenTracker
+from session_cache import SessionCache
+from static_files import CachedStaticFiles
 from session_store import (
     generate_session_id,
     save_session,
@@ -69,11 +82,50 @@ load_dotenv(Path(__file__).parent.parent / ".env")
 # (accumulating across steps). Once complete, everything gets saved
 # to a JSON file and removed from memory.
 #
-# WHY A DICT:
-# Python dicts are hash maps — O(1) lookup by session_id.
-# For a single-user app, this is the simplest approach.
+# WHY A SessionCache (AND NOT A PLAIN DICT):
+# Still O(1) lookup by session_id, but abandoned sessions (closed tab,
+# never reviewed) no longer pile up until restart — entries idle for
+# 2 hours are dropped, and at most 256 are kept. See session_cache.py.
+
+
+@dataclass(slots=True)
+class ActiveSession:
+    """
+    One in-progress training session.
+
+    WHY A SLOTTED DATACLASS (AND NOT A DICT):
+    Every session has the same fields, so there's no need for a
+    per-session hash table of keys. Slots store them in fixed positions —
+    smaller objects and cheaper attribute access — and a typo'd field
+    name fails loudly instead of silently creating a new key.
+    """
+    session_id: str
+    timestamp: str
+    model_used: str
+    domain: str
+    difficulty: str
+    scenario: dict
+    tracker: TokenTracker  # Not serializable — only in memory
+    user_responses: dict = field(default_factory=dict)  # step -> notes
+    time_used: dict = field(default_factory=dict)       # step -> seconds
+
+    # Bumped on every /submit. A review remembers the version it graded
+    # and refuses to save (409) if notes changed underneath it — see
+    # _finish_review.
+    version: int = 0
+
 
-active_sessions: dict[str, dict] = {}
+active_sessions = SessionCache(max_size=256, ttl_seconds=2 * 60 * 60)
+
+
+def _get_session(
+    cache: SessionCache, session_id: str, detail: str = "Session not found"
+) -> ActiveSession | dict:
+    """Look up a session in an active-session cache, or raise the 404 every endpoint returns."""
+    try:
+        return cache[session_id]
+    except KeyError:
+        raise HTTPException(status_code=404, detail=detail) from None
 
 
 # ──────────────────────────────────────────────
@@ -92,9 +144,17 @@ async def lifespan(app: FastAPI):
     yield
     print("👋 Shutting down...")
 
+# WHY ORJSONResponse:
+# Several responses carry whole scenarios (tens of KB of document text).
+# orjson serializes them several times faster than the stdlib encoder
+# and writes UTF-8 bytes directly. The endpoints that return scenario
+# content build an ORJSONResponse themselves, which also skips
+# FastAPI's jsonable_encoder pass — the payloads are plain dicts of
+# JSON types already, so there's nothing for it to convert.
 app = FastAPI(
     title="Engineering Document Practice Tool",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS — allow the frontend dev server to talk to us
@@ -140,8 +200,30 @@ class ConfigUpdate(BaseModel):
     difficulty: Optional[str] = None
 
 
-class ChecklistRow(BaseModel):
-    """A single row in the parameter checklist."""
+# AppConfig fields update_config may set directly — every ConfigUpdate
+# field except model_key, which goes through set_model_key(). An explicit
+# allow-list instead of hasattr() means a field added to AppConfig isn't
+# writable from the API until it's listed here.
+_CONFIG_FIELDS = frozenset({
+    "timer_request",
+    "timer_document",
+    "timer_predictions",
+    "timer_data",
+    "cost_limit",
+    "domain",
+    "difficulty",
+})
+
+
+class ChecklistRow(TypedDict):
+    """
+    A single row in the parameter checklist.
+
+    WHY A TypedDict (AND NOT A BaseModel):
+    Pydantic still validates each row, but hands it back as the plain
+    dict the prompt builders take — no per-row model object to build
+    and then model_dump() straight back into a dict.
+    """
     id: str
     parameter: str
     check: str
@@ -153,9 +235,19 @@ class ChecklistReviewRequest(BaseModel):
     checklist: list[ChecklistRow]
 
 
+class ChecklistsReviewRequest(BaseModel):
+    """Request to review checklists for several documents at once."""
+    reviews: list[ChecklistReviewRequest]
+
+
 # ──────────────────────────────────────────────
 # API Endpoints
 # ──────────────────────────────────────────────
+# WHY asyncio.to_thread FOR session_store CALLS:
+# session_store reads and writes JSON files with ordinary blocking I/O.
+# Called directly inside an async endpoint, that I/O stalls the event
+# loop and every other request waits. to_thread runs it on a worker
+# thread and lets the loop carry on until the result is ready.
 
 @app.post("/api/session/start")
 async def start_session():
@@ -169,17 +261,17 @@ async def start_session():
     4. Return the session ID and the client request (Step 2)
     
     WHY ASYNC:
-    The Claude API call can take 10-30 seconds. Using async means
-    the server isn't blocked while waiting — it could handle other
-    requests (though for single-user that doesn't matter much).
-    Note: The anthropic SDK call itself is synchronous, but wrapping
-    in an async endpoint still keeps FastAPI's event loop responsive.
+    The Claude API call can take 10-30 seconds. We use the async
+    Anthropic client and `await` it, so the event loop is free to
+    serve other requests (other users, the cost poll, document
+    fetches) while this one waits on the network. A blocking SDK call
+    here would freeze the whole server for the duration.
     """
-    session_id = generate_session_id()
+    session_id = await asyncio.to_thread(generate_session_id)
     tracker = TokenTracker()
 
     try:
-        scenario = generate_scenario(tracker)
+        scenario = await generate_scenario_async(tracker)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate scenario: {str(e)}")
 
@@ -191,35 +283,84 @@ async def start_session():
                    f"Raw response: {scenario.get('raw_response', '')[:500]}"
         )
 
+    return _begin_session(session_id, scenario, tracker)
+
+
+# Scenario fields the trainee may see as soon as they're generated.
+# The documents and data are revealed step by step, and the rubric
+# never leaves the server until the review.
+_PREVIEW_SECTIONS = frozenset({"background", "request"})
+
+
+@app.post("/api/session/start/stream")
+async def start_session_stream():
+    """
+    Same as /start, but streams the scenario as server-sent events.
+
+    EVENTS:
+      section  — {"key": "background"|"request", "value": {...}}: that
+                 part of the scenario is fully written (background
+                 arrives first, then the request)
+      complete — the same body /start returns, once the session exists
+      error    — {"detail": "...", "status": 500}: generation failed
+
+    WHY:
+    Generating a scenario takes 10-30 seconds, but the background and
+    request are written first. The UI can show the background while
+    Claude is still writing the documents the trainee won't need yet.
+    """
+    session_id = await asyncio.to_thread(generate_session_id)
+    tracker = TokenTracker()
+
+    async def events():
+        try:
+            scenario = None
+            async for kind, value in generate_scenario_stream(tracker):
+                if kind == "section":
+                    key, section = value
+                    if key in _PREVIEW_SECTIONS:
+                        yield _sse("section", {"key": key, "value": section})
+                else:
+                    scenario = value
+        except Exception as e:
+            yield _sse("error", {"detail": f"Failed to generate scenario: {str(e)}", "status": 500})
+            return
+
+        if "error" in scenario:
+            yield _sse("error", {
+                "detail": f"Scenario generation failed: {scenario.get('error')}",
+                "status": 500,
+            })
+            return
+        yield _sse("complete", _begin_session(session_id, scenario, tracker))
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+def _begin_session(session_id: str, scenario: dict, tracker: TokenTracker) -> dict:
+    """Store a freshly generated scenario as an active session; return the /start body."""
     # Store in memory for the duration of the exercise
-    active_sessions[session_id] = {
-        "session_id": session_id,
-        "timestamp": datetime.now().isoformat(),
-        "model_used": app_config.model.api_name,
-        "domain": app_config.domain or "random",
-        "difficulty": app_config.difficulty,
-        "scenario": scenario,
-        "user_responses": {},
-        "time_used": {},
-        "tracker": tracker,  # Not serializable — only in memory
-    }
+    active_sessions[session_id] = ActiveSession(
+        session_id=session_id,
+        timestamp=datetime.now().isoformat(timespec="seconds"),
+        model_used=app_config.model.api_name,
+        domain=app_config.domain or "random",
+        difficulty=app_config.difficulty,
+        scenario=scenario,
+        tracker=tracker,
+    )
 
     # Return background doc and request (other documents and data are revealed later)
-    # Background timer is half the document timer
-    timer_background = app_config.timer_document // 2
-
     return {
         "session_id": session_id,
         "background": scenario["background"],
         "request": scenario["request"],
-        "config": {
-            "timer_request": app_config.timer_request,
-            "timer_document": app_config.timer_document,
-            "timer_predictions": app_config.timer_predictions,
-            "timer_data": app_config.timer_data,
-            "timer_background": timer_background,
-        },
-        "cost_so_far": tracker.estimate_cost(app_config.model),
+        "config": _cached_config()["session"],
+        "cost_so_far": tracker.estimate_cost(),
     }
 
 
@@ -236,25 +377,21 @@ async def get_document(session_id: str, doc_num: int):
     (In practice, all docs are already in memory from the scenario
     generation. We're just controlling *when* they're revealed.)
     """
-    session = active_sessions.get(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+    session = _get_session(active_sessions, session_id)
 
     if doc_num < 1 or doc_num > 3:
         raise HTTPException(status_code=400, detail="doc_num must be 1, 2, or 3")
 
-    doc = session["scenario"]["documents"][doc_num - 1]  # 0-indexed
-    return {"document": doc}
+    doc = session.scenario["documents"][doc_num - 1]  # 0-indexed
+    return ORJSONResponse({"document": doc})
 
 
 @app.get("/api/session/{session_id}/data")
 async def get_data(session_id: str):
     """Get the data artifact for examination."""
-    session = active_sessions.get(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+    session = _get_session(active_sessions, session_id)
 
-    return {"data": session["scenario"]["data"]}
+    return ORJSONResponse({"data": session.scenario["data"]})
 
 
 @app.post("/api/session/{session_id}/review-checklist")
@@ -265,28 +402,23 @@ async def review_checklist_endpoint(session_id: str, request: ChecklistReviewReq
     Called after each document step to provide immediate feedback on
     what parameters/thresholds were captured vs. missed.
     """
-    session = active_sessions.get(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+    session = _get_session(active_sessions, session_id)
 
     if request.doc_num < 1 or request.doc_num > 3:
         raise HTTPException(status_code=400, detail="doc_num must be 1, 2, or 3")
 
-    tracker: TokenTracker = session["tracker"]
-    scenario = session["scenario"]
+    tracker: TokenTracker = session.tracker
+    scenario = session.scenario
 
     # Get the document and its rubric key concepts
     document = scenario["documents"][request.doc_num - 1]
     rubric_key = f"key_concepts_doc{request.doc_num}"
     rubric_concepts = scenario["rubric"].get(rubric_key, [])
 
-    # Convert checklist to list of dicts
-    checklist_data = [row.model_dump() for row in request.checklist]
-
     try:
-        feedback = review_checklist(
+        feedback = await review_checklist_async(
             document=document,
-            checklist=checklist_data,
+            checklist=request.checklist,
             rubric_key_concepts=rubric_concepts,
             tracker=tracker,
         )
@@ -295,10 +427,57 @@ async def review_checklist_endpoint(session_id: str, request: ChecklistReviewReq
 
     return {
         "feedback": feedback,
-        "cost_so_far": tracker.estimate_cost(app_config.model),
+        "cost_so_far": tracker.estimate_cost(),
     }
 
 
+@app.post("/api/session/{session_id}/review-checklists")
+async def review_checklists_endpoint(session_id: str, request: ChecklistsReviewRequest):
+    """
+    Review checklists for several documents in a single Claude call.
+
+    Cheaper than calling /review-checklist once per document when the
+    feedback isn't needed until all of them are done. Returns one
+    feedback entry per item in `reviews`, in the same order.
+    """
+    session = _get_session(active_sessions, session_id)
+
+    if any(item.doc_num < 1 or item.doc_num > 3 for item in request.reviews):
+        raise HTTPException(status_code=400, detail="doc_num must be 1, 2, or 3")
+
+    tracker: TokenTracker = session.tracker
+    scenario = session.scenario
+
+    try:
+        result = await review_checklists_all_async(
+            documents=[scenario["documents"][item.doc_num - 1] for item in request.reviews],
+            checklists=[item.checklist for item in request.reviews],
+            rubric_key_concepts=[
+                scenario["rubric"].get(f"key_concepts_doc{item.doc_num}", [])
+                for item in request.reviews
+            ],
+            tracker=tracker,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Checklist review failed: {str(e)}")
+
+    if "error" in result:
+        raise HTTPException(status_code=500, detail=f"Checklist review parse error: {result.get('error')}")
+
+    return {
+        "feedback": result["reviews"],
+        "cost_so_far": tracker.estimate_cost(),
+    }
+
+
+# The steps a user can submit notes for
+_VALID_STEPS = frozenset({
+    "background_notes", "deliverable_summary",
+    "doc1_notes", "doc2_notes", "doc3_notes",
+    "data_predictions", "data_notes",
+})
+
+
 @app.post("/api/session/{session_id}/submit")
 async def submit_notes(session_id: str, request: SubmitNotesRequest):
     """
@@ -315,23 +494,17 @@ async def submit_notes(session_id: str, request: SubmitNotesRequest):
     - data_predictions (Step 6)
     - data_notes (Step 7)
     """
-    session = active_sessions.get(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+    session = _get_session(active_sessions, session_id)
 
-    valid_steps = [
-        "background_notes", "deliverable_summary",
-        "doc1_notes", "doc2_notes", "doc3_notes",
-        "data_predictions", "data_notes",
-    ]
-    if request.step not in valid_steps:
+    if request.step not in _VALID_STEPS:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid step '{request.step}'. Must be one of: {valid_steps}"
+            detail=f"Invalid step '{request.step}'. Must be one of: {sorted(_VALID_STEPS)}"
         )
 
-    session["user_responses"][request.step] = request.content
-    session["time_used"][request.step] = request.time_used
+    session.user_responses[request.step] = request.content
+    session.time_used[request.step] = request.time_used
+    session.version += 1
 
     return {"status": "saved", "step": request.step}
 
@@ -343,68 +516,183 @@ async def review_session(session_id: str):
     
     WHAT HAPPENS:
     1. Send scenario + rubric + all user notes to Claude for grading
-    2. Optionally compare to past sessions
+    2. Compare to past sessions in the same call, if there are any
     3. Save the complete session to a JSON file
     4. Remove from active memory
     5. Return feedback to the frontend
     
     THIS IS THE MOST EXPENSIVE API CALL because it sends everything.
     """
-    session = active_sessions.get(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+    session = _get_session(active_sessions, session_id)
 
-    tracker: TokenTracker = session["tracker"]
+    tracker: TokenTracker = session.tracker
+    past_summaries = await asyncio.to_thread(get_past_summaries, 5)
+
+    # The notes being graded — see _finish_review. Captured after the
+    # await above, right before the prompt is built from the notes, as
+    # in /review/stream; a /submit during that await is then graded
+    # rather than rejected with a spurious 409.
+    version = session.version
 
-    # API call #2: Generate review
+    # API call #2: Generate review (plus the comparison, if there's
+    # anything to compare against)
+    # WHY ONE CALL: the comparison only needs the feedback Claude is
+    # writing anyway, so asking for both at once saves a round-trip.
     try:
-        feedback = generate_review(
-            scenario=session["scenario"],
-            user_responses=session["user_responses"],
-            tracker=tracker,
-        )
+        if past_summaries:
+            result = await generate_review_and_comparison_async(
+                scenario=session.scenario,
+                user_responses=session.user_responses,
+                past_summaries=past_summaries,
+                tracker=tracker,
+            )
+        else:
+            result = {
+                "feedback": await generate_review_async(
+                    scenario=session.scenario,
+                    user_responses=session.user_responses,
+                    tracker=tracker,
+                ),
+                "improvement": None,
+            }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Review failed: {str(e)}")
 
-    # API call #3 (optional): Improvement comparison
-    improvement = None
-    past_summaries = get_past_summaries(limit=5)
-    if past_summaries and "error" not in feedback:
+    return ORJSONResponse(
+        await _finish_review(
+            session_id, session, version, result["feedback"], result["improvement"]
+        )
+    )
+
+
+@app.post("/api/session/{session_id}/review/stream")
+async def review_session_stream(session_id: str):
+    """
+    Same as /review, but streams Claude's output as server-sent events.
+
+    EVENTS:
+      delta    — {"text": "..."}: the next piece of the review as Claude
+                 writes it (raw JSON text, useful as a progress signal)
+      complete — the same body /review returns, once everything is saved
+      error    — {"detail": "...", "status": 409|500}: the review failed
+                 or the notes changed mid-review; nothing was saved
+
+    WHY:
+    The review is the slowest call in the app (10-30 seconds). With
+    the plain endpoint the user stares at a spinner for all of it;
+    here they see output from the first token.
+    """
+    session = _get_session(active_sessions, session_id)
+
+    tracker: TokenTracker = session.tracker
+    past_summaries = await asyncio.to_thread(get_past_summaries, 5)
+
+    if past_summaries:
+        stream = generate_review_and_comparison_stream(
+            scenario=session.scenario,
+            user_responses=session.user_responses,
+            past_summaries=past_summaries,
+            tracker=tracker,
+        )
+    else:
+        stream = generate_review_stream(
+            scenario=session.scenario,
+            user_responses=session.user_responses,
+            tracker=tracker,
+        )
+
+    async def events():
+        # Captured here, just before the prompt is built from the notes
+        version = session.version
         try:
-            improvement = generate_improvement_comparison(
-                past_summaries=past_summaries,
-                current_feedback=feedback,
-                tracker=tracker,
+            result = None
+            async for kind, value in stream:
+                if kind == "text":
+                    yield _sse("delta", {"text": value})
+                else:
+                    result = value if past_summaries else {"feedback": value, "improvement": None}
+            body = await _finish_review(
+                session_id, session, version, result["feedback"], result["improvement"]
             )
-        except Exception:
-            # Non-critical — don't fail the review if comparison fails
-            improvement = None
+        except HTTPException as e:
+            yield _sse("error", {"detail": e.detail, "status": e.status_code})
+            return
+        except Exception as e:
+            yield _sse("error", {"detail": f"Review failed: {str(e)}", "status": 500})
+            return
+        yield _sse("complete", body)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+def _sse(event: str, data: dict) -> bytes:
+    """Format one server-sent event."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _finish_review(
+    session_id: str,
+    session: ActiveSession,
+    version: int,
+    feedback: dict,
+    improvement: Optional[dict],
+) -> dict:
+    """
+    Everything after the review call: saving the session and dropping
+    it from memory. Returns the response body for the frontend.
+
+    `version` is session.version from when the review started.
+
+    WHY A VERSION CHECK (AND NOT A LOCK):
+    A second tab or a retried request can /submit notes while the
+    review is running. Saving then would store feedback for notes that
+    are no longer the ones on record. A per-session lock would make
+    /submit wait out the whole 10-30 second review; instead, /submit
+    just bumps the version and the review checks it before saving. On
+    a mismatch nothing is saved and the session stays active, so the
+    frontend can simply review again.
+    """
+    if session.version != version:
+        raise HTTPException(
+            status_code=409,
+            detail="Notes changed while the review was running. Review again to include them.",
+        )
+
+    tracker: TokenTracker = session.tracker
 
-    # Build the complete session record
+    # Build the complete session record: every ActiveSession field
+    # except the tracker (not serializable), plus the results. The values
+    # are shared with the session, not copied — the scenario alone can
+    # be tens of KB and is only read from here on.
     session_data = {
-        "session_id": session["session_id"],
-        "timestamp": session["timestamp"],
-        "model_used": session["model_used"],
-        "domain": session["domain"],
-        "difficulty": session["difficulty"],
-        "scenario": session["scenario"],
-        "user_responses": session["user_responses"],
-        "time_used": session["time_used"],
+        "session_id": session.session_id,
+        "timestamp": session.timestamp,
+        "model_used": session.model_used,
+        "domain": session.domain,
+        "difficulty": session.difficulty,
+        "scenario": session.scenario,
+        "user_responses": session.user_responses,
+        "time_used": session.time_used,
         "feedback": feedback,
         "improvement": improvement,
-        "token_usage": tracker.to_dict(app_config.model),
+        "token_usage": tracker.to_dict(),
     }
 
     # Save to disk
-    save_session(session_id, session_data)
+    await asyncio.to_thread(save_session, session_id, session_data)
 
-    # Remove from active memory
-    del active_sessions[session_id]
+    # Remove from active memory (pop, not del — it may have been
+    # evicted while we were waiting on Claude)
+    active_sessions.pop(session_id)
 
     return {
         "feedback": feedback,
         "improvement": improvement,
-        "token_usage": tracker.to_dict(app_config.model),
+        "token_usage": session_data["token_usage"],
     }
 
 
@@ -416,64 +704,85 @@ async def get_session(session_id: str):
     Checks active memory first, then falls back to disk.
     """
     # Check active sessions
-    if session_id in active_sessions:
-        session = active_sessions[session_id]
-        return {
-            "session_id": session["session_id"],
-            "timestamp": session["timestamp"],
-            "scenario": session["scenario"],
-            "user_responses": session["user_responses"],
-            "time_used": session["time_used"],
+    session = active_sessions.get(session_id)
+    if session is not None:
+        return ORJSONResponse({
+            "session_id": session.session_id,
+            "timestamp": session.timestamp,
+            "scenario": session.scenario,
+            "user_responses": session.user_responses,
+            "time_used": session.time_used,
             "status": "in_progress",
-        }
+        })
 
     # Check saved sessions
-    data = load_session(session_id)
+    data = await asyncio.to_thread(load_session, session_id)
     if not data:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    data["status"] = "complete"
-    return data
+    # A copy with the status added — load_session's dict is shared
+    return ORJSONResponse({**data, "status": "complete"})
 
 
 @app.get("/api/sessions")
-async def get_sessions():
-    """List all past sessions (summary only)."""
-    return {"sessions": list_sessions()}
+async def get_sessions(limit: Optional[int] = Query(None, ge=1)):
+    """List past sessions (summary only), newest first — all, or the newest `limit`."""
+    return {"sessions": await asyncio.to_thread(list_sessions, limit)}
 
 
 @app.get("/api/cost/{session_id}")
 async def get_cost(session_id: str):
     """Get current cost estimate for an active session."""
-    session = active_sessions.get(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found (may be completed)")
+    session = _get_session(active_sessions, session_id, detail="Session not found (may be completed)")
 
-    tracker: TokenTracker = session["tracker"]
+    tokens = session.tracker.to_dict()
     return {
-        "cost": tracker.estimate_cost(app_config.model),
+        "cost": tokens["estimated_cost"],  # Already computed by to_dict()
         "limit": app_config.cost_limit,
-        "tokens": tracker.to_dict(app_config.model),
+        "tokens": tokens,
     }
 
 
+# WHY CACHED:
+# The frontend reads the config often, but it only changes through
+# PATCH /api/config. Both response dicts are built once per
+# app_config.version and reused until update_config bumps it.
+_config_cache: dict = {"version": None, "response": None, "session": None}
+
+
+def _cached_config() -> dict:
+    """Return {"response": GET /api/config body, "session": start_session timers}."""
+    if _config_cache["version"] != app_config.version:
+        _config_cache["response"] = {
+            "model_key": app_config.model_key,
+            "model_name": app_config.model.display_name,
+            "available_models": {
+                k: v.display_name for k, v in MODELS.items()
+            },
+            "timer_request": app_config.timer_request,
+            "timer_document": app_config.timer_document,
+            "timer_predictions": app_config.timer_predictions,
+            "timer_data": app_config.timer_data,
+            "cost_limit": app_config.cost_limit,
+            "domain": app_config.domain,
+            "difficulty": app_config.difficulty,
+        }
+        _config_cache["session"] = {
+            "timer_request": app_config.timer_request,
+            "timer_document": app_config.timer_document,
+            "timer_predictions": app_config.timer_predictions,
+            "timer_data": app_config.timer_data,
+            # Background timer is half the document timer
+            "timer_background": app_config.timer_document // 2,
+        }
+        _config_cache["version"] = app_config.version
+    return _config_cache
+
+
 @app.get("/api/config")
 async def get_config():
     """Get current configuration."""
-    return {
-        "model_key": app_config.model_key,
-        "model_name": app_config.model.display_name,
-        "available_models": {
-            k: v.display_name for k, v in MODELS.items()
-        },
-        "timer_request": app_config.timer_request,
-        "timer_document": app_config.timer_document,
-        "timer_predictions": app_config.timer_predictions,
-        "timer_data": app_config.timer_data,
-        "cost_limit": app_config.cost_limit,
-        "domain": app_config.domain,
-        "difficulty": app_config.difficulty,
-    }
+    return _cached_config()["response"]
 
 
 @app.patch("/api/config")
@@ -493,9 +802,18 @@ async def update_config(update: ConfigUpdate):
     """
     updates = update.model_dump(exclude_unset=True)
 
+    # model_key goes through set_model_key so app_config.model follows it
+    if "model_key" in updates:
+        try:
+            app_config.set_model_key(updates.pop("model_key"))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    # setattr, not __dict__ — AppConfig is slotted and has no __dict__
     for key, value in updates.items():
-        if hasattr(app_config, key):
+        if key in _CONFIG_FIELDS:
             setattr(app_config, key, value)
+    app_config.version += 1
 
     return await get_config()
 
@@ -505,8 +823,8 @@ async def update_config(update: ConfigUpdate):
 # ──────────────────────────────────────────────
 # Simpler mobile-focused practice sessions.
 
-# In-memory storage for active quick sessions
-active_quick_sessions: dict[str, dict] = {}
+# In-memory storage for active quick sessions (same eviction rules)
+active_quick_sessions = SessionCache(max_size=256, ttl_seconds=2 * 60 * 60)
 
 DURATION_SECONDS = {
     "5min": 300,
@@ -537,11 +855,11 @@ async def start_quick_session(request: QuickStartRequest):
     if request.duration_mode not in DURATION_SECONDS:
         raise HTTPException(status_code=400, detail="Invalid duration mode")
 
-    session_id = generate_quick_session_id()
+    session_id = await asyncio.to_thread(generate_quick_session_id)
     tracker = TokenTracker()
 
     try:
-        scenario = generate_quick_scenario(
+        scenario = await generate_quick_scenario_async(
             duration_mode=request.duration_mode,
             domain=app_config.domain,
             tracker=tracker,
@@ -555,7 +873,7 @@ async def start_quick_session(request: QuickStartRequest):
     # Store in memory
     active_quick_sessions[session_id] = {
         "session_id": session_id,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
         "duration_mode": request.duration_mode,
         "scenario": scenario,
         "tracker": tracker,
@@ -574,15 +892,13 @@ async def submit_quick_session(session_id: str, request: QuickSubmitRequest):
     """
     Submit a response and get grading.
     """
-    session = active_quick_sessions.get(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+    session = _get_session(active_quick_sessions, session_id)
 
     tracker: TokenTracker = session["tracker"]
     scenario = session["scenario"]
 
     try:
-        feedback = grade_quick_response(
+        feedback = await grade_quick_response_async(
             question=scenario["question"],
             documents=scenario["documents"],
             key_facts=scenario["key_facts"],
@@ -610,12 +926,13 @@ async def submit_quick_session(session_id: str, request: QuickSubmitRequest):
         "time_used": request.time_used,
         "device": request.device,
         "feedback": feedback,
-        "token_usage": tracker.to_dict(app_config.model),
+        "token_usage": tracker.to_dict(),
     }
-    save_quick_session(session_id, session_data)
+    await asyncio.to_thread(save_quick_session, session_id, session_data)
 
-    # Remove from active memory
-    del active_quick_sessions[session_id]
+    # Remove from active memory (pop, not del — it may have been
+    # evicted while we were waiting on Claude)
+    active_quick_sessions.pop(session_id)
 
     return {"feedback": feedback}
 
@@ -623,21 +940,39 @@ async def submit_quick_session(session_id: str, request: QuickSubmitRequest):
 @app.get("/api/quick/sessions")
 async def get_quick_sessions():
     """List all past quick practice sessions."""
-    return {"sessions": list_quick_sessions()}
+    return {"sessions": await asyncio.to_thread(list_quick_sessions)}
 
 
-# Serve frontend static files (if built)
+# Serve frontend static files (if built) — with cache headers and
+# precompressed variants, see static_files.py
 # Check for mobile-dist first (deployed version), then regular frontend
 MOBILE_DIST_DIR = Path(__file__).parent.parent / "mobile-dist"
 
 if MOBILE_DIST_DIR.exists():
     # Deployed version - serve mobile app
-    app.mount("/", StaticFiles(directory=str(MOBILE_DIST_DIR), html=True), name="mobile")
+    app.mount("/", CachedStaticFiles(directory=str(MOBILE_DIST_DIR), html=True), name="mobile")
 elif FRONTEND_DIR.exists():
     # Local dev - serve desktop frontend
-    app.mount("/", StaticFiles(directory=str(FRONTEND_DIR), html=True), name="frontend")
+    app.mount("/", CachedStaticFiles(directory=str(FRONTEND_DIR), html=True), name="frontend")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # uvicorn[standard] installs uvloop (a libuv event loop) and httptools
+    # (a C HTTP parser); uvicorn picks both up automatically, falling
+    # back to asyncio/h11 where they aren't available (uvloop has no
+    # Windows build).
+    #
+    # WHY ONE WORKER BY DEFAULT:
+    # Active sessions live in this process's memory. With several
+    # workers, a session started on one would be missing on the next
+    # request's worker. Only raise WEB_CONCURRENCY behind a proxy with
+    # sticky sessions.
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        "main:app" if workers > 1 else app,  # workers need an import string
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+    )
@@ -13,31 +13,112 @@ PROMPT ENGINEERING NOTES:
   what the right answers are when it grades later
 """
 
+import functools
+import logging
+import re
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# WHY SHARED:
+# Every prompt ends its instructions with the same output rule. One
+# constant keeps the wording identical everywhere (and in one place).
+#
+# WHY MINIFIED:
+# Indentation and line breaks in the response are output tokens — the
+# slowest and most expensive kind — and we parse the JSON anyway. The
+# wording is deliberately explicit: a bare "output compact JSON" tends
+# to be read as "shorter content" rather than "less whitespace".
+#
+# No "no markdown fences, no preamble" clause: claude_client slices the
+# JSON out of whatever surrounds it, and a response that still doesn't
+# parse gets one JSON_REPAIR call (below) instead.
+_JSON_ONLY = (
+    "Return ONLY valid JSON, output directly as "
+    "minified JSON: delete all spacing, newlines, and indentation between JSON tokens, "
+    "provided it doesn't violate any syntax rules (text inside strings stays as written)."
+)
+
+_JSON_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+_AROUND_PUNCTUATION = re.compile(r"\s*([{}\[\],:])\s*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _minify_example(example: str) -> str:
+    """
+    Strip the layout whitespace out of an output_format example.
+
+    WHY:
+    The examples below are indented so they're easy to read and edit
+    here, but every space and newline is an input token on every call.
+    Claude reads the structure just as well without them. Text inside
+    strings is left alone, and so are the bits that aren't strictly
+    JSON (`1-5`, `...`), which is why this isn't json.loads + dumps.
+    """
+    parts = []
+    last = 0
+    for match in _JSON_STRING.finditer(example):
+        parts.append(_squeeze(example[last:match.start()]))
+        parts.append(match.group())
+        last = match.end()
+    parts.append(_squeeze(example[last:]))
+    return "".join(parts)
+
+
+def _squeeze(text: str) -> str:
+    """Drop whitespace next to JSON punctuation; collapse the rest to one space."""
+    return _WHITESPACE.sub(" ", _AROUND_PUNCTUATION.sub(r"\1", text))
+
+
+# ──────────────────────────────────────────────
+# GRADING SCALES
+# ──────────────────────────────────────────────
+# The full review scores each category 1-5; quick practice gives one
+# 1-10 score (the mobile app shows it as "n/10"). Each scale is one
+# line, defined once, and joined into its prompts at import time, so
+# every prompt is still a fixed string.
+
+_GRADING_SCALE_5 = (
+    "Scores: 1=major gaps, unclear, or largely incorrect; 2=below expectations, "
+    "significant room for improvement; 3=meets basic expectations, some gaps; "
+    "4=good work, minor areas for improvement; 5=excellent, thorough and well-executed"
+)
+
+_GRADING_SCALE_10 = (
+    "Scores: 9-10=all key facts, excellent engineering language, well-structured; "
+    "7-8=most key facts, good language with minor issues; 5-6=some key facts, "
+    "language needs work or poor structure; 3-4=few key facts, unprofessional language; "
+    "1-2=missed the point entirely"
+)
+
+
 # ──────────────────────────────────────────────
 # SCENARIO GENERATION PROMPT
 # ──────────────────────────────────────────────
 # This is the big one. One API call generates the entire exercise.
+#
+# WHY SO TERSE:
+# System prompts are paid for on every call (cached or not), so they
+# say each thing once, in bullets, without filler.
 
-SCENARIO_SYSTEM_PROMPT = """You are a scenario generator for an engineering document analysis training tool. Your job is to create realistic, challenging engineering scenarios that test a trainee's ability to read technical documents, extract key information, and analyze data.
-
-You will generate a complete training scenario as a single JSON object. The scenario simulates an internal client making a request to an engineer.
+SCENARIO_SYSTEM_PROMPT = """You generate realistic, challenging scenarios for an engineering document analysis training tool. Each scenario tests a trainee's ability to read technical documents, extract key information, and analyze data, framed as an internal client making a request to an engineer.
 
 <output_format>
-Return ONLY valid JSON with this exact structure (no markdown fences, no preamble):
-{
+""" + _JSON_ONLY + """ Use exactly this structure:
+""" + _minify_example("""{
   "background": {
-    "title": "A professional document title (e.g. 'Fundamentals of Cooling Tower Operation' or 'Introduction to Structural Load Analysis')",
-    "content": "A background/theory document that explains the key concepts, terminology, and principles the trainee needs to understand this scenario. Format this as a professional document (excerpt from a manual, textbook chapter, or technical guide) — NOT as a vocabulary list. Same length as the other documents. Should cover: system components, how they work together, key parameters/metrics, and what 'good' vs 'problematic' looks like in this domain."
+    "title": "Professional document title (e.g. 'Fundamentals of Cooling Tower Operation')",
+    "content": "Background/theory document explaining the concepts, terminology, and principles needed for this scenario, written as a professional document (manual excerpt, textbook section, technical guide) — NOT a vocabulary list. Same length as the other documents. Cover: system components, how they interact, key parameters/metrics, and what 'good' vs 'problematic' looks like."
   },
   "request": {
     "from": "Name, Title at Department",
     "subject": "Brief subject line",
-    "body": "The client's request, scaled to time available (see content_length_requirements). Be specific about what deliverable they need. Include enough context that the trainee can infer what format and content the final deliverable should have, but don't spell it out explicitly."
+    "body": "The client's request, length per content_length_requirements. Specific about the deliverable they need, with enough context to infer its format and content without spelling it out."
   },
   "documents": [
     {
       "title": "Document title (e.g. 'Thermal Analysis Report — Section 3.2')",
-      "content": "Technical content scaled to time available (see content_length_requirements). Include specific numbers, specifications, constraints, or findings that are relevant to answering the client's request. Each document should contribute DIFFERENT information — no redundancy."
+      "content": "Technical content, length per content_length_requirements. Specific numbers, specifications, constraints, or findings relevant to the request. Each document contributes DIFFERENT information."
     },
     {
       "title": "Second document title",
@@ -50,106 +131,117 @@ Return ONLY valid JSON with this exact structure (no markdown fences, no preambl
   ],
   "data": {
     "format": "table | values | text_output",
-    "description": "Brief description of what this data represents",
-    "content": "The actual data. For tables, use markdown table format. For values, use labeled numbers. For text output, use a realistic output format. The data should contain patterns or values that, combined with the documents, allow the trainee to draw conclusions and answer the client's request."
+    "description": "What this data represents",
+    "content": "The data: markdown table, labeled numbers, or realistic text output. Its patterns, combined with the documents, let the trainee draw conclusions and answer the request."
   },
   "rubric": {
-    "deliverable_description": "What the ideal deliverable should look like — format, sections, key elements the trainee should identify in Step 2.",
-    "key_concepts_doc1": ["Key concepts/facts from document 1 — number scaled to content_length_requirements"],
+    "deliverable_description": "The ideal deliverable — format, sections, key elements the trainee should identify in Step 2",
+    "key_concepts_doc1": ["Key concepts/facts from document 1 — count per content_length_requirements"],
     "key_concepts_doc2": ["Key concepts/facts from document 2 — same count as doc1"],
     "key_concepts_doc3": ["Key concepts/facts from document 3 — same count as doc1"],
-    "expected_data_patterns": ["Patterns the trainee should predict — number scaled to content_length_requirements"],
-    "data_analysis_points": ["Things to notice in the data — number scaled to content_length_requirements"],
-    "critical_connections": ["1-2 connections between documents and data that demonstrate understanding"]
+    "expected_data_patterns": ["Patterns the trainee should predict — count per content_length_requirements"],
+    "data_analysis_points": ["Things to notice in the data — count per content_length_requirements"],
+    "critical_connections": ["1-2 document-to-data connections that demonstrate understanding"]
   }
-}
+}""") + """
 </output_format>
 
 <quality_guidelines>
-- Make the scenario realistic and internally consistent
-- The background document should read like a real professional document (manual excerpt, textbook section, technical guide) — NOT a vocabulary list or glossary. It should flow naturally and explain concepts in context.
-- The background document should give the trainee enough theoretical grounding to understand the scenario, even if they have no prior knowledge of this engineering domain
-- Documents should feel like real engineering artifacts (reports, specs, memos, test results)
-- Data should have clear patterns that connect to the documents, but also some noise
-- The rubric should be thorough but fair — don't expect the trainee to catch obscure details
-- Include at least one "gotcha" or subtle detail that rewards careful reading
-- Numbers should be realistic for the domain
+- Realistic and internally consistent
+- Background flows like a real professional document, explaining concepts in context — not a glossary
+- Background gives enough grounding for a trainee new to this domain
+- Documents feel like real engineering artifacts (reports, specs, memos, test results)
+- Data has clear patterns tied to the documents, plus some noise
+- Rubric is thorough but fair — no obscure details
+- At least one "gotcha" or subtle detail that rewards careful reading
+- Numbers realistic for the domain
 </quality_guidelines>"""
 
 
-def get_scenario_user_prompt(
-    domain: str | None,
-    difficulty: str,
-    timer_request: int = 420,
-    timer_document: int = 420,
-    timer_data: int = 420,
-) -> str:
+# Content length per timer bucket: (longest timer in seconds, guidance).
+# Read-only views, because get_length_guidance hands out the same
+# objects to every caller.
+_LENGTH_BUCKETS: tuple[tuple[int, MappingProxyType], ...] = (
+    (90, MappingProxyType({  # 1.5 min or less
+        "request": "1 short paragraph (2-3 sentences)",
+        "document": "2-3 sentences with 1-2 key facts each",
+        "data_rows": "3-5 rows",
+        "key_concepts": "1-2",
+        "data_points": "2-3",
+    })),
+    (180, MappingProxyType({  # 3 min or less
+        "request": "1 paragraph (4-5 sentences)",
+        "document": "1 paragraph (4-6 sentences) with 2-3 key facts each",
+        "data_rows": "5-7 rows",
+        "key_concepts": "2-3",
+        "data_points": "3-4",
+    })),
+    (300, MappingProxyType({  # 5 min or less
+        "request": "1-2 paragraphs",
+        "document": "1-2 paragraphs with 3-4 key facts each",
+        "data_rows": "7-10 rows",
+        "key_concepts": "3-4",
+        "data_points": "3-4",
+    })),
+)
+
+# 5+ min (standard)
+_LENGTH_STANDARD = MappingProxyType({
+    "request": "2-3 paragraphs",
+    "document": "2 full paragraphs with 4-5 key facts each",
+    "data_rows": "10-14 rows",
+    "key_concepts": "3-5",
+    "data_points": "3-5",
+})
+
+
+@functools.lru_cache(maxsize=16)
+def get_length_guidance(seconds: int) -> MappingProxyType:
     """
-    Build the user prompt for scenario generation.
-
-    WHY A FUNCTION INSTEAD OF A CONSTANT:
-    The domain, difficulty, and timer settings are configurable, so we need to
-    insert them dynamically. The system prompt stays fixed,
-    but this part changes.
+    How much content to generate for a section the trainee gets `seconds` for.
 
-    Timer settings affect content length:
-    - 7 min (420s) = standard length (2 paragraphs per doc, full data table)
-    - 3 min (180s) = short (1 paragraph per doc, smaller data set)
-    - 1 min (60s) = minimal (2-3 sentences per doc, few data points)
+    Cached: timers come from a handful of settings values, so after the
+    first session this is a dict lookup. The result is read-only.
     """
-    domain_instruction = (
-        f"The scenario should be in the {domain} engineering domain."
-        if domain
-        else "Choose an appropriate engineering domain (nuclear, civil, mechanical, electrical, chemical, aerospace, environmental, etc.)."
-    )
+    for max_seconds, guidance in _LENGTH_BUCKETS:
+        if seconds <= max_seconds:
+            return guidance
+    return _LENGTH_STANDARD
 
-    difficulty_map = {
-        "beginner": "Use straightforward technical language. The connections between documents and data should be relatively obvious. Include 1-2 key concepts per document.",
-        "intermediate": "Use realistic technical language appropriate to the domain. Connections between documents require careful reading. Include subtle details that reward thorough analysis.",
-        "advanced": "Use dense, domain-specific technical language. Include some contradictory or ambiguous information that requires critical thinking. The data should have non-obvious patterns.",
-    }
 
+# Extra instruction per difficulty tier; unknown tiers fall back to intermediate
+_DIFFICULTY_MAP = MappingProxyType({
+    "beginner": "Use straightforward technical language. The connections between documents and data should be relatively obvious. Include 1-2 key concepts per document.",
+    "intermediate": "Use realistic technical language appropriate to the domain. Connections between documents require careful reading. Include subtle details that reward thorough analysis.",
+    "advanced": "Use dense, domain-specific technical language. Include some contradictory or ambiguous information that requires critical thinking. The data should have non-obvious patterns.",
+})
+
+_RANDOM_DOMAIN_INSTRUCTION = "Choose an appropriate engineering domain (nuclear, civil, mechanical, electrical, chemical, aerospace, environmental, etc.)."
+
+
+@functools.lru_cache(maxsize=32)
+def _domain_instruction(domain: str | None) -> str:
+    """The domain sentence of the scenario prompt. Domains are a short fixed list."""
+    if domain:
+        return f"The scenario should be in the {domain} engineering domain."
+    return _RANDOM_DOMAIN_INSTRUCTION
+
+
+@functools.lru_cache(maxsize=64)
+def _length_instructions(timer_request: int, timer_document: int, timer_data: int) -> str:
+    """
+    The <content_length_requirements> block for one combination of timers.
+
+    Cached: the timers come from settings and rarely change, so every
+    scenario after the first reuses the same string.
+    """
     # Scale content length based on timer settings
     # Use the document timer as the primary guide since that's the bulk of reading
-    def get_length_guidance(seconds: int) -> dict:
-        if seconds <= 90:  # 1.5 min or less
-            return {
-                "request": "1 short paragraph (2-3 sentences)",
-                "document": "2-3 sentences with 1-2 key facts each",
-                "data_rows": "3-5 rows",
-                "key_concepts": "1-2",
-                "data_points": "2-3",
-            }
-        elif seconds <= 180:  # 3 min or less
-            return {
-                "request": "1 paragraph (4-5 sentences)",
-                "document": "1 paragraph (4-6 sentences) with 2-3 key facts each",
-                "data_rows": "5-7 rows",
-                "key_concepts": "2-3",
-                "data_points": "3-4",
-            }
-        elif seconds <= 300:  # 5 min or less
-            return {
-                "request": "1-2 paragraphs",
-                "document": "1-2 paragraphs with 3-4 key facts each",
-                "data_rows": "7-10 rows",
-                "key_concepts": "3-4",
-                "data_points": "3-4",
-            }
-        else:  # 5+ min (standard)
-            return {
-                "request": "2-3 paragraphs",
-                "document": "2 full paragraphs with 4-5 key facts each",
-                "data_rows": "10-14 rows",
-                "key_concepts": "3-5",
-                "data_points": "3-5",
-            }
-
     request_guide = get_length_guidance(timer_request)
     doc_guide = get_length_guidance(timer_document)
     data_guide = get_length_guidance(timer_data)
 
-    length_instructions = f"""
+    return f"""
 <content_length_requirements>
 The trainee has limited time for each section. Scale content appropriately:
 
@@ -162,11 +254,35 @@ The trainee has limited time for each section. Scale content appropriately:
 IMPORTANT: Do not exceed these lengths. A shorter exercise should still be coherent and have clear connections between documents and data, just with less content to process.
 </content_length_requirements>"""
 
-    return f"""{domain_instruction}
+
+def get_scenario_user_prompt(
+    domain: str | None,
+    difficulty: str,
+    timer_request: int = 420,
+    timer_document: int = 420,
+    timer_data: int = 420,
+) -> str:
+    """
+    Build the user prompt for scenario generation.
+
+    WHY A FUNCTION INSTEAD OF A CONSTANT:
+    The domain, difficulty, and timer settings are configurable, so we need to
+    insert them dynamically. The system prompt stays fixed,
+    but this part changes.
+
+    Timer settings affect content length:
+    - 7 min (420s) = standard length (2 paragraphs per doc, full data table)
+    - 3 min (180s) = short (1 paragraph per doc, smaller data set)
+    - 1 min (60s) = minimal (2-3 sentences per doc, few data points)
+
+    Each piece is a closed set (domains, tiers, timer settings), so the
+    pieces are built once and looked up here.
+    """
+    return f"""{_domain_instruction(domain)}
 
 Difficulty level: {difficulty}
-{difficulty_map.get(difficulty, difficulty_map['intermediate'])}
-{length_instructions}
+{_DIFFICULTY_MAP.get(difficulty, _DIFFICULTY_MAP['intermediate'])}
+{_length_instructions(timer_request, timer_document, timer_data)}
 
 Generate the complete scenario now."""
 
@@ -177,26 +293,26 @@ Generate the complete scenario now."""
 # Sent after the user completes all steps.
 # Receives: the original scenario + rubric + all user notes.
 
-REVIEW_SYSTEM_PROMPT = """You are an evaluator for an engineering document analysis training exercise. You will receive:
-1. The original scenario (client request, documents, data, and a grading rubric)
-2. The trainee's notes from each step of the exercise
+REVIEW_SYSTEM_PROMPT = """You evaluate an engineering document analysis training exercise. Input:
+1. The original scenario (client request, documents, data, grading rubric)
+2. The trainee's notes from each step
 
-Your job is to provide detailed, constructive feedback. Be encouraging but honest. The goal is to help them improve.
+Give detailed, constructive feedback — honest, aimed at helping them improve.
 
 <output_format>
-Return ONLY valid JSON with this structure (no markdown fences, no preamble):
-{
+""" + _JSON_ONLY + """ Use this structure:
+""" + _minify_example("""{
   "deliverable_understanding": {
     "score": 1-5,
-    "feedback": "2-3 sentences evaluating how well they understood what the client needs. Did they identify the correct format, sections, and key elements? Reference specific things they said (or missed)."
+    "feedback": "2-3 sentences: did they understand what the client needs (format, sections, key elements)? Cite what they said or missed."
   },
   "note_quality": {
     "score": 1-5,
-    "feedback": "2-3 sentences on grammar, sentence structure, and clarity. They don't need complete sentences, but notes should be understandable by someone else. Point out specific examples of unclear or well-written notes."
+    "feedback": "2-3 sentences on grammar, structure, and clarity. Complete sentences aren't required, but someone else must understand the notes. Cite unclear or well-written examples."
   },
   "note_efficiency": {
     "score": 1-5,
-    "feedback": "2-3 sentences on whether their notes are well-organized for the time constraints. Are they too verbose? Too sparse? Good use of bullets and hierarchy? Suggest specific improvements."
+    "feedback": "2-3 sentences: are the notes organized for the time limit — too verbose, too sparse, good bullets/hierarchy? Suggest specific improvements."
   },
   "concept_extraction": {
     "doc1": {
@@ -233,25 +349,21 @@ Return ONLY valid JSON with this structure (no markdown fences, no preamble):
   },
   "overall": {
     "score": 1-5,
-    "summary": "3-4 sentence overall assessment. Highlight their biggest strength and most important area for improvement.",
-    "top_improvement": "The single most impactful thing they could do differently next time"
+    "summary": "3-4 sentences: biggest strength and most important area for improvement",
+    "top_improvement": "The single most impactful thing to do differently next time"
   }
-}
+}""") + """
 </output_format>
 
 <grading_guidelines>
-- Score 1: Major gaps, unclear, or largely incorrect
-- Score 2: Below expectations, significant room for improvement
-- Score 3: Meets basic expectations, some gaps
-- Score 4: Good work, minor areas for improvement
-- Score 5: Excellent, thorough and well-executed
-- Be specific in feedback — reference actual content from their notes
-- Grammar feedback should focus on clarity, not pedantic rules
-- Remember they were under time pressure — evaluate accordingly
+- """ + _GRADING_SCALE_5 + """
+- Reference actual content from their notes
+- Grammar feedback: clarity, not pedantic rules
+- They were under time pressure — grade accordingly
 </grading_guidelines>"""
 
 
-def get_review_user_prompt(scenario: dict, user_responses: dict) -> str:
+def get_review_user_prompt(scenario: dict, user_responses: dict) -> list[dict]:
     """
     Build the user prompt for the review call.
     
@@ -260,8 +372,26 @@ def get_review_user_prompt(scenario: dict, user_responses: dict) -> str:
     So we need to send the entire scenario (including the rubric it
     generated earlier) plus all of the user's notes in one message.
     This is why the review call has the most input tokens.
+
+    WHY TWO BLOCKS:
+    The scenario half never changes during a session; the notes half
+    does. Putting a cache breakpoint after </scenario> means a repeated
+    review (a retry, or a re-review after a 409) only pays full price
+    for the notes.
     """
-    return f"""Here is the complete scenario and the trainee's responses:
+    # One short tag per document, numbered to match the doc1/doc2/doc3
+    # keys in the output format
+    documents = scenario["documents"]
+    docs_text = "\n\n".join([
+        f"<doc i=\"{i}\"><t>{doc['title']}</t>\n{doc['content']}\n</doc>"
+        for i, doc in enumerate(documents, 1)
+    ])
+    notes_text = "\n\n".join([
+        f"<doc_notes i=\"{i}\">\n{_capped_response(user_responses, f'doc{i}_notes', '(no notes)')}\n</doc_notes>"
+        for i in range(1, len(documents) + 1)
+    ])
+
+    scenario_text = f"""Here is the complete scenario and the trainee's responses:
 
 <scenario>
 <request>
@@ -271,20 +401,9 @@ Subject: {scenario['request']['subject']}
 {scenario['request']['body']}
 </request>
 
-<document_1>
-Title: {scenario['documents'][0]['title']}
-{scenario['documents'][0]['content']}
-</document_1>
-
-<document_2>
-Title: {scenario['documents'][1]['title']}
-{scenario['documents'][1]['content']}
-</document_2>
-
-<document_3>
-Title: {scenario['documents'][2]['title']}
-{scenario['documents'][2]['content']}
-</document_3>
+<documents>
+{docs_text}
+</documents>
 
 <data>
 Format: {scenario['data']['format']}
@@ -297,93 +416,144 @@ Description: {scenario['data']['description']}
 </rubric>
 </scenario>
 
-<trainee_responses>
+"""
+    responses_text = f"""<trainee_responses>
 <deliverable_summary>
-{user_responses.get('deliverable_summary', '(no response)')}
+{_capped_response(user_responses, 'deliverable_summary', '(no response)')}
 </deliverable_summary>
 
-<doc1_notes>
-{user_responses.get('doc1_notes', '(no notes)')}
-</doc1_notes>
-
-<doc2_notes>
-{user_responses.get('doc2_notes', '(no notes)')}
-</doc2_notes>
-
-<doc3_notes>
-{user_responses.get('doc3_notes', '(no notes)')}
-</doc3_notes>
+{notes_text}
 
 <data_predictions>
-{user_responses.get('data_predictions', '(no predictions)')}
+{_capped_response(user_responses, 'data_predictions', '(no predictions)')}
 </data_predictions>
 
 <data_notes>
-{user_responses.get('data_notes', '(no notes)')}
+{_capped_response(user_responses, 'data_notes', '(no notes)')}
 </data_notes>
 </trainee_responses>
 
 Evaluate the trainee's performance according to the rubric and your grading guidelines."""
 
+    return [_cacheable(scenario_text), _text(responses_text)]
+
+
+# Longest a trainee response can be in the review prompt, per step.
+# Notes written under a timer rarely come near this; the cap is there
+# so a pasted wall of text can't run up the cost of the review.
+_RESPONSE_CAPS = MappingProxyType({
+    "deliverable_summary": 1500,
+    "doc1_notes": 1200,
+    "doc2_notes": 1200,
+    "doc3_notes": 1200,
+    "data_predictions": 1500,
+    "data_notes": 1500,
+})
+
+
+def _capped_response(user_responses: dict, step: str, default: str) -> str:
+    """The trainee's response for `step`, cut to its cap (logged when it is)."""
+    text = user_responses.get(step, default)
+    limit = _RESPONSE_CAPS.get(step)
+    if limit is None or len(text) <= limit:
+        return text
+    logger.warning("Truncated %s from %d to %d characters for review", step, len(text), limit)
+    return _shorten(text, limit, " …[truncated]")
+
+
+def _cacheable(text: str) -> dict:
+    """A user-message text block with a prompt-cache breakpoint after it."""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+def _text(text: str) -> dict:
+    """A plain user-message text block."""
+    return {"type": "text", "text": text}
+
 
 def _format_rubric(rubric: dict) -> str:
     """Helper to format the rubric dict into readable text for the prompt."""
-    lines = []
-    lines.append(f"Ideal deliverable: {rubric['deliverable_description']}")
-    lines.append(f"\nKey concepts Doc 1: {', '.join(rubric['key_concepts_doc1'])}")
-    lines.append(f"Key concepts Doc 2: {', '.join(rubric['key_concepts_doc2'])}")
-    lines.append(f"Key concepts Doc 3: {', '.join(rubric['key_concepts_doc3'])}")
-    lines.append(f"\nExpected data patterns: {', '.join(rubric['expected_data_patterns'])}")
-    lines.append(f"Data analysis points: {', '.join(rubric['data_analysis_points'])}")
-    lines.append(f"Critical connections: {', '.join(rubric['critical_connections'])}")
-    return "\n".join(lines)
+    return "\n".join((
+        f"Ideal deliverable: {rubric['deliverable_description']}",
+        "",
+        f"Key concepts Doc 1: {', '.join(rubric['key_concepts_doc1'])}",
+        f"Key concepts Doc 2: {', '.join(rubric['key_concepts_doc2'])}",
+        f"Key concepts Doc 3: {', '.join(rubric['key_concepts_doc3'])}",
+        "",
+        f"Expected data patterns: {', '.join(rubric['expected_data_patterns'])}",
+        f"Data analysis points: {', '.join(rubric['data_analysis_points'])}",
+        f"Critical connections: {', '.join(rubric['critical_connections'])}",
+    ))
 
 
 # ──────────────────────────────────────────────
-# IMPROVEMENT COMPARISON PROMPT (optional)
+# PAST SESSION SUMMARIES
 # ──────────────────────────────────────────────
-# Only used when there are previous sessions to compare against.
 
-IMPROVEMENT_SYSTEM_PROMPT = """You are tracking a trainee's progress across multiple engineering document analysis sessions. You will receive summaries of their past sessions and their current session's feedback.
+# Past-session summaries are 3-4 sentences; this keeps the gist and caps
+# what five of them can add to the prompt
+_PAST_SUMMARY_CHARS = 200
 
-Provide a brief comparison noting:
-1. Areas of improvement since previous sessions
-2. Persistent weaknesses that still need work
-3. New strengths that have emerged
 
-Return ONLY valid JSON:
-{
-  "improvements": ["List of specific improvements"],
-  "persistent_issues": ["Issues that keep appearing"],
-  "new_strengths": ["Things they're doing well that they weren't before"],
-  "overall_trend": "One sentence: are they improving, plateauing, or declining?",
-  "recommendation": "One specific thing to focus on next session"
-}"""
+def _format_past_summaries(past_summaries: list[dict]) -> str:
+    """Helper: one short block per past session (last 5 max)."""
+    return "".join([
+        f"\nSession {i} (score: {summary.get('overall_score', 'N/A')}):\n"
+        f"  Top improvement area: {summary.get('top_improvement', 'N/A')}\n"
+        f"  Summary: {_shorten(summary.get('summary', 'N/A'), _PAST_SUMMARY_CHARS)}\n"
+        for i, summary in enumerate(past_summaries[-5:], 1)  # Last 5 sessions max
+    ])
+
 
+def _shorten(text: str, limit: int, marker: str = "…") -> str:
+    """text, cut at the last word break before `limit` characters if it's longer."""
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0] + marker
 
-def get_improvement_user_prompt(past_summaries: list[dict], current_feedback: dict) -> str:
-    """Build prompt comparing current session to past ones."""
-    past_text = ""
-    for i, summary in enumerate(past_summaries[-5:], 1):  # Last 5 sessions max
-        past_text += f"\nSession {i} (score: {summary.get('overall_score', 'N/A')}):\n"
-        past_text += f"  Top improvement area: {summary.get('top_improvement', 'N/A')}\n"
-        past_text += f"  Summary: {summary.get('summary', 'N/A')}\n"
 
-    return f"""Past session summaries:{past_text}
+# ──────────────────────────────────────────────
+# REVIEW + IMPROVEMENT COMPARISON IN ONE CALL
+# ──────────────────────────────────────────────
+# Used instead of the review prompt when there are past sessions.
+# WHY: the comparison only needs the overall feedback plus the past
+# summaries, and Claude has just written that feedback. Asking for both
+# at once saves a whole round-trip and a second prefill.
+
+REVIEW_WITH_COMPARISON_SYSTEM_PROMPT = REVIEW_SYSTEM_PROMPT + """
+
+<progress_comparison>
+You will also receive summaries of the trainee's past sessions. After grading this session, compare it to them, noting:
+1. Areas of improvement since previous sessions
+2. Persistent weaknesses that still need work
+3. New strengths that have emerged
+</progress_comparison>
+
+<combined_output_format>
+This overrides the top level of output_format — return ONE object, the graded feedback under "feedback" and the comparison under "improvement". """ + _JSON_ONLY + """ Use this structure:
+""" + _minify_example("""{
+  "feedback": { ...the object described in output_format... },
+  "improvement": {
+    "improvements": ["List of specific improvements"],
+    "persistent_issues": ["Issues that keep appearing"],
+    "new_strengths": ["Things they're doing well that they weren't before"],
+    "overall_trend": "One sentence: are they improving, plateauing, or declining?",
+    "recommendation": "One specific thing to focus on next session"
+  }
+}""") + """
+</combined_output_format>"""
+
 
-Current session feedback:
-Overall score: {current_feedback['overall']['score']}/5
-Summary: {current_feedback['overall']['summary']}
-Top improvement: {current_feedback['overall']['top_improvement']}
+def get_review_with_comparison_prompt(
+    scenario: dict, user_responses: dict, past_summaries: list[dict]
+) -> list[dict]:
+    """Build the review prompt plus the past-session summaries to compare against."""
+    scenario_block, responses_block = get_review_user_prompt(scenario, user_responses)
+    return [scenario_block, _text(f"""{responses_block['text']}
 
-Scores: Deliverable={current_feedback['deliverable_understanding']['score']}, 
-Notes={current_feedback['note_quality']['score']}, 
-Efficiency={current_feedback['note_efficiency']['score']},
-Predictions={current_feedback['data_predictions']['score']},
-Analysis={current_feedback['data_analysis']['score']},
-Formatting={current_feedback['formatting']['score']}
+<past_sessions>{_format_past_summaries(past_summaries)}</past_sessions>
 
-Compare and provide your assessment."""
+Then compare this session to the past sessions.""")]
 
 
 # ──────────────────────────────────────────────
@@ -391,34 +561,43 @@ Compare and provide your assessment."""
 # ──────────────────────────────────────────────
 # Used after each document to review what parameters the trainee captured.
 
-CHECKLIST_REVIEW_SYSTEM_PROMPT = """You are reviewing a trainee's parameter checklist for an engineering document analysis exercise.
+CHECKLIST_REVIEW_SYSTEM_PROMPT = """You review a trainee's parameter checklist for an engineering document analysis exercise. They read a document and listed the parameters, thresholds, limits, and criteria they found; identify which important ones they captured and which they missed.
 
-The trainee has read a document and created a checklist of parameters, thresholds, limits, and criteria they found. Your job is to identify what important parameters they captured and what they missed.
-
-Return ONLY valid JSON (no markdown fences, no preamble):
-{
+""" + _JSON_ONLY + """ Use this structure:
+""" + _minify_example("""{
   "captured": ["List of parameters/thresholds they correctly identified"],
   "missed": ["List of important parameters/thresholds they should have caught but didn't"],
   "feedback": "1-2 sentences of constructive feedback"
-}
+}""") + """
 
 Guidelines:
 - Focus on quantitative thresholds, limits, criteria, and key parameters
-- Only list items as "missed" if they are genuinely important for the task
-- Be encouraging but honest
-- If they captured most things well, say so"""
+- "missed" only for items genuinely important to the task
+- Encouraging but honest; if they captured most things, say so"""
+
+
+def get_checklist_review_prompt(document: dict, checklist: list[dict], rubric_key_concepts: list[str]) -> list[dict]:
+    """
+    Build prompt to review the trainee's parameter checklist for a document.
 
+    The document half is cached (see get_review_user_prompt): when the
+    trainee edits the checklist and asks again, only the checklist is new.
+    """
+    return [
+        _cacheable(_format_checklist_document(document, rubric_key_concepts)),
+        _text(f"""{_format_checklist_entries(checklist)}
+
+Review what parameters and thresholds the trainee captured vs. missed."""),
+    ]
 
-def get_checklist_review_prompt(document: dict, checklist: list[dict], rubric_key_concepts: list[str]) -> str:
-    """Build prompt to review the trainee's parameter checklist for a document."""
-    checklist_text = ""
-    for row in checklist:
-        if row.get("parameter") or row.get("check"):
-            checklist_text += f"- Parameter: {row.get('parameter', '')} | Check: {row.get('check', '')}\n"
 
-    if not checklist_text:
-        checklist_text = "(No entries in checklist)"
+def _format_checklist_section(document: dict, checklist: list[dict], rubric_key_concepts: list[str]) -> str:
+    """Helper: one document, its rubric concepts, and the trainee's checklist."""
+    return _format_checklist_document(document, rubric_key_concepts) + _format_checklist_entries(checklist)
 
+
+def _format_checklist_document(document: dict, rubric_key_concepts: list[str]) -> str:
+    """Helper: the document and its rubric concepts (the part that doesn't change)."""
     return f"""Document:
 Title: {document['title']}
 {document['content']}
@@ -426,10 +605,72 @@ Title: {document['title']}
 Key concepts that should be extracted (from rubric):
 {chr(10).join('- ' + c for c in rubric_key_concepts)}
 
-Trainee's checklist:
-{checklist_text}
+"""
+
+
+def _format_checklist_entries(checklist: list[dict]) -> str:
+    """
+    Helper: the trainee's checklist rows, as a markdown table.
+
+    A table states "Parameter" and "Check" once in the header instead
+    of on every row. Empty rows (the UI always shows a few) are skipped.
+    """
+    rows = [
+        f"| {_table_cell(row.get('parameter', ''))} | {_table_cell(row.get('check', ''))} |"
+        for row in checklist
+        if row.get("parameter") or row.get("check")
+    ]
+    if not rows:
+        return "Trainee's checklist:\n(No entries in checklist)"
+    return "Trainee's checklist:\n| Parameter | Check |\n|---|---|\n" + "\n".join(rows)
+
+
+def _table_cell(text: str) -> str:
+    """text made safe for one markdown table cell."""
+    return text.replace("|", "\\|").replace("\n", " ")
+
+
+# Same review, but for several documents in one call. One round trip
+# (and one copy of the instructions) instead of one per document.
+
+CHECKLISTS_REVIEW_SYSTEM_PROMPT = """You review a trainee's parameter checklists for an engineering document analysis exercise. For each of several documents they listed the parameters, thresholds, limits, and criteria they found; for EACH document, identify which important ones they captured and which they missed.
+
+""" + _JSON_ONLY + """ Use this structure, one review per document, in the order given:
+""" + _minify_example("""{
+  "reviews": [
+    {
+      "captured": ["List of parameters/thresholds they correctly identified"],
+      "missed": ["List of important parameters/thresholds they should have caught but didn't"],
+      "feedback": "1-2 sentences of constructive feedback"
+    }
+  ]
+}""") + """
+
+Guidelines:
+- Review each document only against its own checklist
+- Focus on quantitative thresholds, limits, criteria, and key parameters
+- "missed" only for items genuinely important to the task
+- Encouraging but honest; if they captured most things, say so"""
+
 
-Review what parameters and thresholds the trainee captured vs. missed."""
+def get_checklists_review_prompt(
+    documents: list[dict],
+    checklists: list[list[dict]],
+    rubric_key_concepts: list[list[str]],
+) -> str:
+    """Build one prompt reviewing several (document, checklist) pairs."""
+    sections = []
+    for i, (document, checklist, concepts) in enumerate(
+        zip(documents, checklists, rubric_key_concepts), 1
+    ):
+        sections.append(f"""<document_{i}>
+{_format_checklist_section(document, checklist, concepts)}
+</document_{i}>""")
+
+    return "\n\n".join(sections) + f"""
+
+Review what parameters and thresholds the trainee captured vs. missed in each document.
+Return exactly {len(sections)} reviews, in document order."""
 
 
 # ──────────────────────────────────────────────
@@ -437,11 +678,11 @@ Review what parameters and thresholds the trainee captured vs. missed."""
 # ──────────────────────────────────────────────
 # Simpler, faster scenarios for mobile practice.
 
-QUICK_SCENARIO_SYSTEM_PROMPT = """You are a scenario generator for a quick engineering practice tool. Generate concise engineering scenarios with bullet points that answer a specific question.
+QUICK_SCENARIO_SYSTEM_PROMPT = """You generate concise engineering scenarios for a quick practice tool: short bullet-point documents that together answer a specific question.
 
-Return ONLY valid JSON (no markdown fences, no preamble):
-{
-  "question": "A specific engineering question that the trainee must answer based on the documents below. Should require synthesizing information across documents.",
+""" + _JSON_ONLY + """ Use this structure:
+""" + _minify_example("""{
+  "question": "A specific engineering question, answerable only by synthesizing information across the documents",
   "documents": [
     {
       "title": "Document title (e.g., 'Pump Station Spec Sheet')",
@@ -449,30 +690,30 @@ Return ONLY valid JSON (no markdown fences, no preamble):
     }
   ],
   "key_facts": ["List of key facts the trainee should identify to answer the question correctly"],
-  "ideal_response": "A concise, properly-formatted technical memo or calculation response that correctly answers the question using information from the documents"
-}
+  "ideal_response": "A concise, properly formatted technical memo or calculation that correctly answers the question from the documents"
+}""") + """
 
 Guidelines:
-- Each bullet should be a complete, information-dense statement
-- Include specific numbers, thresholds, parameters, and criteria
-- The question should require connecting information across documents
-- Bullets should be in proper engineering language
-- The ideal response should demonstrate professional engineering communication"""
+- Each bullet: a complete, information-dense statement in proper engineering language
+- Specific numbers, thresholds, parameters, and criteria
+- Ideal response demonstrates professional engineering communication"""
 
 
-def get_quick_scenario_user_prompt(duration_mode: str, domain: str | None) -> str:
-    """Build prompt for quick scenario generation."""
+# Scenario size per duration mode; anything else gets the 20min size
+_QUICK_STRUCTURE = MappingProxyType({
+    "5min": "2 documents with 2-3 bullets each (5 total bullets)",
+    "10min": "3 documents with 3-4 bullets each (9-10 total bullets)",
+    "20min": "3 documents with 5 bullets each (15 total bullets)",
+})
+
+_QUICK_RANDOM_DOMAIN = "Domain: Choose randomly from mechanical, electrical, civil, chemical, or environmental engineering"
 
-    if duration_mode == "5min":
-        structure = "2 documents with 2-3 bullets each (5 total bullets)"
-    elif duration_mode == "10min":
-        structure = "3 documents with 3-4 bullets each (9-10 total bullets)"
-    else:  # 20min
-        structure = "3 documents with 5 bullets each (15 total bullets)"
 
+def get_quick_scenario_user_prompt(duration_mode: str, domain: str | None) -> str:
+    """Build prompt for quick scenario generation."""
+    structure = _QUICK_STRUCTURE.get(duration_mode, _QUICK_STRUCTURE["20min"])
     domain_instruction = (
-        f"Domain: {domain}" if domain and domain != "random"
-        else "Domain: Choose randomly from mechanical, electrical, civil, chemical, or environmental engineering"
+        f"Domain: {domain}" if domain and domain != "random" else _QUICK_RANDOM_DOMAIN
     )
 
     return f"""{domain_instruction}
@@ -485,26 +726,21 @@ Generate a quick practice scenario with:
 The scenario should be completable in the time allotted if the trainee reads efficiently and writes concisely."""
 
 
-QUICK_GRADE_SYSTEM_PROMPT = """You are grading a trainee's response to an engineering scenario. Evaluate their response against the ideal and provide detailed feedback.
+QUICK_GRADE_SYSTEM_PROMPT = """You grade a trainee's response to an engineering scenario against the ideal, with detailed feedback.
 
-Return ONLY valid JSON (no markdown fences, no preamble):
-{
+""" + _JSON_ONLY + """ Use this structure:
+""" + _minify_example("""{
   "score": 7,
   "key_facts_identified": ["List facts they correctly identified"],
   "key_facts_missed": ["List important facts they missed"],
-  "language_feedback": "Assessment of their engineering language - is it appropriately technical, professional, and precise?",
-  "structure_feedback": "Assessment of response structure - is it organized like a proper technical memo/calculation?",
-  "density_suggestion": "Specific suggestion for how they could have made the language more information-dense. Quote their text and show how to improve it.",
+  "language_feedback": "Is their engineering language appropriately technical, professional, and precise?",
+  "structure_feedback": "Is the response organized like a proper technical memo/calculation?",
+  "density_suggestion": "How to make the language more information-dense — quote their text and show the improvement",
   "ideal_response": "The ideal response for comparison",
   "overall_comment": "1-2 sentences of overall feedback"
-}
+}""") + """
 
-Scoring guide:
-- 9-10: Identified all key facts, excellent engineering language, well-structured
-- 7-8: Most key facts, good language with minor issues
-- 5-6: Some key facts, language needs work or poor structure
-- 3-4: Few key facts, unprofessional language
-- 1-2: Missed the point entirely"""
+""" + _GRADING_SCALE_10
 
 
 def get_quick_grade_user_prompt(
@@ -516,11 +752,12 @@ def get_quick_grade_user_prompt(
 ) -> str:
     """Build prompt for grading a quick practice response."""
 
-    docs_text = ""
+    # One list, one join — instead of growing a string bullet by bullet
+    parts = []
     for doc in documents:
-        docs_text += f"\n{doc['title']}:\n"
-        for bullet in doc["bullets"]:
-            docs_text += f"  - {bullet}\n"
+        parts.append(f"\n{doc['title']}:\n")
+        parts.extend(f"  - {bullet}\n" for bullet in doc["bullets"])
+    docs_text = "".join(parts)
 
     return f"""Question: {question}
 
@@ -537,3 +774,24 @@ Trainee's response:
 {user_response}
 
 Grade the trainee's response. Be constructive but honest."""
+
+
+# ──────────────────────────────────────────────
+# JSON REPAIR PROMPT
+# ──────────────────────────────────────────────
+# Sent only when a response fails to parse or doesn't match its schema.
+# Gets the broken text and the parser's complaint — not the original
+# prompts — so it's a small call next to the one it's fixing.
+
+JSON_REPAIR_SYSTEM_PROMPT = """You fix malformed JSON. You receive JSON that failed to parse or to match its expected structure, and the error message. Return the same content as valid JSON with the error fixed, changing only what the error requires. """ + _JSON_ONLY + """ Keep the structure of the input."""
+
+
+def get_json_repair_prompt(raw_response: str, parse_error: str) -> str:
+    """Build the prompt for repairing one unparseable response."""
+    return f"""<error>
+{parse_error}
+</error>
+
+<json>
+{raw_response}
+</json>"""
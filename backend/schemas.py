@@ -0,0 +1,171 @@
+"""
+Expected shapes of Claude's JSON responses.
+
+WHY THIS FILE EXISTS:
+Every prompt in prompts.py asks Claude for JSON with a specific
+structure. These types write that structure down once, so
+claude_client.py can check each response as it parses it — a missing
+key or a wrong type is caught right away instead of surfacing later
+as a KeyError in an endpoint or a blank panel in the UI.
+
+WHY TypedDict (AND NOT msgspec.Struct):
+msgspec decodes straight into TypedDicts, validating in C as it goes.
+The result is still a plain dict, which is what every caller, the
+session files, and the prompt builders already work with. Keys that
+aren't listed here are dropped.
+
+The shapes mirror frontend/src/types.ts and mobile/src/api.ts.
+"""
+
+from typing import Any, NotRequired, TypedDict
+
+# Claude sometimes writes 4.0 or 3.5 for a score
+Score = int | float
+
+
+# ──────────────────────────────────────────────
+# SCENARIO (generate_scenario)
+# ──────────────────────────────────────────────
+
+class Document(TypedDict):
+    title: str
+    content: str
+
+
+# "from" is a Python keyword, so this one uses the functional syntax
+ClientRequest = TypedDict("ClientRequest", {"from": str, "subject": str, "body": str})
+
+
+class DataArtifact(TypedDict):
+    format: str
+    description: str
+    content: str
+
+
+class Rubric(TypedDict):
+    deliverable_description: str
+    key_concepts_doc1: list[str]
+    key_concepts_doc2: list[str]
+    key_concepts_doc3: list[str]
+    expected_data_patterns: list[str]
+    data_analysis_points: list[str]
+    critical_connections: list[str]
+
+
+class ScenarioResponse(TypedDict):
+    background: Document
+    request: ClientRequest
+    documents: list[Document]
+    data: DataArtifact
+    rubric: Rubric
+
+
+# ──────────────────────────────────────────────
+# REVIEW (generate_review)
+# ──────────────────────────────────────────────
+
+class ScoredFeedback(TypedDict):
+    score: Score
+    feedback: str
+
+
+class DocConceptFeedback(TypedDict):
+    found: list[str]
+    missed: list[str]
+    feedback: str
+
+
+class ConceptExtraction(TypedDict):
+    doc1: DocConceptFeedback
+    doc2: DocConceptFeedback
+    doc3: DocConceptFeedback
+
+
+class PredictionFeedback(TypedDict):
+    score: Score
+    correct_predictions: list[str]
+    missed_predictions: list[str]
+    feedback: str
+
+
+class AnalysisFeedback(TypedDict):
+    score: Score
+    correct_observations: list[str]
+    missed_observations: list[str]
+    feedback: str
+
+
+class OverallFeedback(TypedDict):
+    score: Score
+    summary: str
+    top_improvement: str
+
+
+class ReviewResponse(TypedDict):
+    deliverable_understanding: ScoredFeedback
+    note_quality: ScoredFeedback
+    note_efficiency: ScoredFeedback
+    concept_extraction: ConceptExtraction
+    data_predictions: PredictionFeedback
+    data_analysis: AnalysisFeedback
+    formatting: ScoredFeedback
+    overall: OverallFeedback
+
+
+# ──────────────────────────────────────────────
+# IMPROVEMENT COMPARISON / CHECKLIST REVIEW
+# ──────────────────────────────────────────────
+
+class ImprovementResponse(TypedDict):
+    improvements: list[str]
+    persistent_issues: list[str]
+    new_strengths: list[str]
+    overall_trend: str
+    recommendation: str
+
+
+class ReviewWithComparisonResponse(TypedDict):
+    feedback: ReviewResponse
+    # Best-effort: a missing or malformed comparison must not cost the
+    # user their feedback, so it isn't checked here. claude_client.py
+    # checks it against ImprovementResponse on its own and drops it
+    # (improvement=None) if it doesn't fit.
+    improvement: NotRequired[Any]
+
+
+class ChecklistReviewResponse(TypedDict):
+    captured: list[str]
+    missed: list[str]
+    feedback: str
+
+
+class ChecklistReviewsResponse(TypedDict):
+    reviews: list[ChecklistReviewResponse]
+
+
+# ──────────────────────────────────────────────
+# QUICK PRACTICE
+# ──────────────────────────────────────────────
+
+class QuickDocument(TypedDict):
+    title: str
+    bullets: list[str]
+
+
+class QuickScenarioResponse(TypedDict):
+    question: str
+    documents: list[QuickDocument]
+    key_facts: list[str]
+    ideal_response: str
+
+
+class QuickGradeResponse(TypedDict):
+    score: Score
+    key_facts_identified: list[str]
+    key_facts_missed: list[str]
+    language_feedback: str
+    structure_feedback: str
+    density_suggestion: str
+    ideal_response: NotRequired[str]
+    overall_comment: str
+
@@ -0,0 +1,91 @@
+"""
+Bounded in-memory storage for in-progress sessions.
+
+WHY THIS EXISTS:
+main.py keeps every in-progress session in memory (the whole scenario
+plus a TokenTracker). A plain dict never forgets anything: a session
+that's started but never reviewed — closed tab, crashed phone — stays
+there until the server restarts. SessionCache caps that in two ways:
+
+  - Idle timeout: a session nobody has touched for `ttl_seconds` is dropped
+  - Size limit: past `max_size` entries, the least recently used goes
+
+HOW IT WORKS:
+An OrderedDict kept in "least recently touched first" order. Every read
+or write moves the entry to the end and stamps the time, so expired
+entries are always at the front and eviction just pops from there
+until it hits one that's still fresh.
+
+It behaves like the dict it replaces (get, [], in, del, pop), so endpoint
+code barely had to change.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class SessionCache:
+    """A dict-like store that evicts idle and least-recently-used sessions."""
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 2 * 60 * 60):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # session_id -> (last_touched, value), least recently touched first
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def _touch(self, session_id: str, value: Any):
+        self._entries[session_id] = (time.monotonic(), value)
+        self._entries.move_to_end(session_id)
+
+    def sweep(self) -> int:
+        """Drop every entry idle for longer than the TTL. Returns how many."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        evicted = 0
+        while self._entries:
+            oldest_id, (touched, _) = next(iter(self._entries.items()))
+            if touched >= cutoff:
+                break
+            del self._entries[oldest_id]
+            evicted += 1
+        return evicted
+
+    def get(self, session_id: str, default: Optional[Any] = None) -> Any:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return default
+        if entry[0] < time.monotonic() - self.ttl_seconds:
+            # Expired but not swept yet — treat as gone
+            del self._entries[session_id]
+            return default
+        self._touch(session_id, entry[1])
+        return entry[1]
+
+    def __getitem__(self, session_id: str) -> Any:
+        value = self.get(session_id, _MISSING)
+        if value is _MISSING:
+            raise KeyError(session_id)
+        return value
+
+    def __setitem__(self, session_id: str, value: Any):
+        self._touch(session_id, value)
+        self.sweep()
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __delitem__(self, session_id: str):
+        del self._entries[session_id]
+
+    def pop(self, session_id: str, default: Optional[Any] = None) -> Any:
+        entry = self._entries.pop(session_id, None)
+        return default if entry is None else entry[1]
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Sentinel for "not found" — None could be a legitimate stored value
+_MISSING = object()
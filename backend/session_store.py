@@ -3,7 +3,8 @@ Session storage — save and load training sessions as JSON files.
 
 WHY JSON FILES:
 For a single-user training tool, JSON files are perfect:
-  - Human-readable (you can open them in any text editor)
+  - Human-readable (open one in any text editor, or print it indented
+    with `python session_store.py <session_id>`)
   - No database setup required
   - Easy to back up (just copy the folder)
   - Easy to migrate later if needed
@@ -16,21 +17,370 @@ FILE STRUCTURE:
     2026-02-07_001.json
     2026-02-07_002.json
     2026-02-08_001.json
+    _index.jsonl        ← one summary line per session (see SESSION INDEX)
+    .state/counters.json ← last session ID issued per day (see SESSION ID COUNTERS)
+    .state/counters.lock ← held while an ID is issued
 """
 
+import contextlib
+import functools
 import json
+import mmap
 import os
-from datetime import datetime
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
 from typing import Optional
 
+# orjson serializes and parses large scenarios several times faster than
+# the stdlib and works on UTF-8 bytes directly. Its JSONDecodeError
+# subclasses json.JSONDecodeError, so the except clauses below work
+# with either.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+    _json_loads = json.loads
+
 # Where session files live — relative to the project root
 SESSIONS_DIR = Path(__file__).parent.parent / "sessions"
 
 
+# Bumped by every save_session; cached results built from the sessions
+# directory are only valid for the version they were built at.
+_sessions_version = 0
+
+# get_past_summaries results: {"key": (version, dir mtime), "by_limit": {limit: [...]}}
+_summaries_cache: dict = {"key": None, "by_limit": {}}
+
+# Whole list_sessions / list_quick_sessions results, keyed like
+# _summaries_cache: {"key": (version, dir mtime), "sessions": [...]}
+_sessions_list_cache: dict = {"key": None, "sessions": []}
+_quick_list_cache: dict = {"key": None, "sessions": []}
+
+# Guards the version counters and the caches above. They're used from
+# asyncio.to_thread workers, so a save can bump a version while a list
+# is being built; the lists are built outside the lock and stored only
+# if the version they were built at is still current. Otherwise a list
+# missing the new session would be cached under the new key.
+_cache_lock = threading.Lock()
+
+
+# Directories already created by this process. mkdir(exist_ok=True) is a
+# syscall every time, and _ensure_dir runs on every save and list, so it's
+# done once per path. Keyed by path rather than a single flag so that
+# pointing SESSIONS_DIR somewhere else still creates the new directory.
+_ready_dirs: set[Path] = set()
+
+
+def _make_dir(directory: Path):
+    """mkdir -p directory, once per process."""
+    if directory not in _ready_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ready_dirs.add(directory)
+
+
 def _ensure_dir():
     """Create the sessions directory if it doesn't exist."""
-    SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+    _make_dir(SESSIONS_DIR)
+
+
+def _dump_json(data: dict, pretty: bool = False) -> bytes:
+    """
+    Compact UTF-8 JSON with a trailing newline, or indented like
+    json.dump(indent=2) when pretty is set.
+
+    OPT_NON_STR_KEYS: orjson rejects int (etc.) dict keys outright,
+    where json.dump writes them as strings. Keep json's behavior so a
+    stray int key can't make a finished session unsaveable.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8") + b"\n"
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _read_json(filepath) -> dict:
+    """Parse a JSON file in one read — no Python-level file iteration."""
+    return _json_loads(Path(filepath).read_bytes())
+
+
+def _load_json(filepath: Path) -> Optional[dict]:
+    """
+    A saved session file, parsed — or None if there isn't one.
+
+    WHY CACHED:
+    Opening a session from the history page re-fetches it every time,
+    and a full session is tens of KB of JSON. The cache key includes
+    the file's mtime and size, so a rewritten file is a cache miss and
+    is read fresh; nothing has to be invalidated by hand.
+    Callers must not mutate the returned dict.
+    """
+    try:
+        st = os.stat(filepath)
+        return _load_json_cached(str(filepath), st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _load_json_cached(filepath: str, mtime_ns: int, size: int) -> dict:
+    """_read_json, memoized by (path, mtime, size) — see _load_json."""
+    return _read_json(filepath)
+
+
+# Below this size a plain read is cheaper than setting up a mapping
+_MMAP_MIN_BYTES = 4096
+
+# Readahead hint for mapped files. posix_fadvise is Linux/BSD only.
+_fadvise = getattr(os, "posix_fadvise", None)
+
+
+def _scan_json(filepath) -> dict:
+    """
+    Parse a JSON file for the bulk scans (list_sessions and friends).
+
+    WHY mmap:
+    A full session is tens of KB, and the scans parse a whole directory
+    of them. Mapping the file lets orjson parse straight out of the page
+    cache instead of first copying the file into a bytes object. Small
+    files, and the stdlib fallback (which can't parse a buffer), use a
+    plain read.
+    """
+    with open(filepath, "rb") as f:
+        if orjson is None or os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return _json_loads(f.read())
+        if _fadvise is not None:
+            # orjson faults the mapping in page by page; ask the kernel to
+            # start reading the whole file now instead of one fault at a time.
+            _fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # The view must be released before the mapping can close
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
+def _try_scan_json(filepath) -> Optional[dict]:
+    """_scan_json, or None if the file isn't valid JSON."""
+    try:
+        return _scan_json(filepath)
+    except json.JSONDecodeError:
+        return None
+
+
+# Reads for _scan_sessions. Opening and reading a file is mostly waiting
+# on the disk (or a network volume), and threads overlap those waits.
+_READ_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="session-read")
+
+
+def _scan_sessions(directory: Path, session_ids: list[str]) -> list[Optional[dict]]:
+    """
+    Parse several session files at once, in the order given.
+
+    Corrupt files come back as None. A single file is read inline —
+    there's nothing to overlap.
+    """
+    paths = [directory / f"{session_id}.json" for session_id in session_ids]
+    if len(paths) < 2:
+        return [_try_scan_json(path) for path in paths]
+    return list(_READ_POOL.map(_try_scan_json, paths))
+
+
+def _current_umask() -> int:
+    """The process umask. There's no way to read it without setting it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Permissions for new files: open()'s 0o666, minus the umask. Read once
+# at import — the umask is process-wide and setting it isn't thread-safe.
+_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def _write_json_atomic(filepath: Path, data: dict, pretty: bool = False):
+    """
+    Write data as JSON to filepath so readers never see a half-written file.
+
+    HOW:
+    Write everything to a temp file in the same directory, then
+    os.replace() it over the real name. The rename is atomic, so a
+    crash mid-write leaves the old file (or no file), never a
+    truncated one.
+
+    WHY NO fsync:
+    These are completion records for a training tool, not bank
+    transactions. Skipping fsync avoids stalling on a disk flush; the
+    OS writes the data out shortly anyway. Only review/submit calls
+    write here — in-progress notes live in memory until then.
+    """
+    # Serialize before creating the temp file, so a bad value can't leave one behind
+    buf = memoryview(_dump_json(data, pretty))
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, suffix=".tmp")
+    try:
+        # Straight to the fd: one write() syscall for any realistic
+        # session. The loop only matters if the kernel takes less.
+        try:
+            while buf:
+                buf = buf[os.write(fd, buf):]
+        finally:
+            os.close(fd)
+        # mkstemp creates 0600; give the file what a normal open() would.
+        # os.chmod by path, since os.fchmod is missing on Windows < 3.13.
+        os.chmod(tmp_path, _FILE_MODE)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# ──────────────────────────────────────────────
+# SESSION INDEX
+# ──────────────────────────────────────────────
+# WHY AN INDEX:
+# The history lists only need a few fields per session, but getting
+# them meant opening and parsing every session file. Instead, each
+# save also appends that session's list row to _index.jsonl (one JSON
+# object per line) in the same directory, and the lists read that one
+# file. The .jsonl suffix keeps it out of every "*.json" scan.
+#
+# The directory stays the source of truth: a session file with no index
+# row (older sessions, files copied in by hand) is parsed once and its
+# row appended; a row whose file is gone is left out. A session that's
+# saved again gets a new row, and the last row for an ID wins.
+# rebuild_index() rewrites an index from scratch, e.g. after editing
+# session files by hand.
+
+INDEX_FILENAME = "_index.jsonl"
+
+
+def _dump_line(row: dict) -> bytes:
+    """One compact JSON line for an index file."""
+    if orjson is not None:
+        return orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return json.dumps(row, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _append_index(directory: Path, rows: list[dict]):
+    """Append rows to directory's index in one write."""
+    with open(directory / INDEX_FILENAME, "ab") as f:
+        f.write(b"".join(_dump_line(row) for row in rows))
+
+
+def _read_index(directory: Path) -> dict[str, dict]:
+    """{session_id: row} from directory's index; {} if there isn't one yet."""
+    try:
+        raw = (directory / INDEX_FILENAME).read_bytes()
+    except FileNotFoundError:
+        return {}
+    rows = {}
+    for line in raw.splitlines():
+        try:
+            row = _json_loads(line)
+        except json.JSONDecodeError:
+            continue  # A torn last line from a crash mid-append
+        session_id = row.get("session_id") if isinstance(row, dict) else None
+        if not isinstance(session_id, str):
+            continue  # Hand-edited or otherwise malformed; its file gets re-indexed
+        rows[session_id] = row
+    return rows
+
+
+def _session_ids(directory: Path) -> list[str]:
+    """IDs of the session files in directory, newest first."""
+    with os.scandir(directory) as it:
+        ids = [e.name[:-len(".json")] for e in it if e.name.endswith(".json") and e.is_file()]
+    ids.sort(reverse=True)
+    return ids
+
+
+def _indexed_rows(directory: Path, summarize) -> list[dict]:
+    """
+    The list row for every session file in directory, newest first.
+
+    Rows come from the index; files missing from it are parsed with
+    summarize(session_id, data) and their rows appended for next time.
+    """
+    index = _read_index(directory)
+    session_ids = _session_ids(directory)
+
+    unindexed = [session_id for session_id in session_ids if session_id not in index]
+    missing = []
+    for session_id, data in zip(unindexed, _scan_sessions(directory, unindexed)):
+        if data is None:
+            continue  # Skip corrupted files
+        try:
+            row = summarize(session_id, data)
+        except KeyError:
+            continue
+        index[session_id] = row
+        missing.append(row)
+    if missing:
+        _append_index(directory, missing)
+
+    return [index[session_id] for session_id in session_ids if session_id in index]
+
+
+def _session_row(session_id: str, data: dict) -> dict:
+    """The list_sessions row for one full session."""
+    return {
+        "session_id": session_id,
+        "timestamp": data.get("timestamp", ""),
+        "domain": data.get("domain", "unknown"),
+        "difficulty": data.get("difficulty", "unknown"),
+        "model_used": data.get("model_used", "unknown"),
+        "overall_score": (
+            data.get("feedback", {})
+            .get("overall", {})
+            .get("score", None)
+        ),
+        "estimated_cost": (
+            data.get("token_usage", {})
+            .get("estimated_cost", None)
+        ),
+    }
+
+
+def _quick_session_row(session_id: str, data: dict) -> dict:
+    """The list_quick_sessions row for one quick session."""
+    return {
+        "session_id": session_id,
+        "timestamp": data.get("timestamp", ""),
+        "duration_mode": data.get("duration_mode", "unknown"),
+        "question": data.get("question", ""),
+        "user_response": data.get("user_response", ""),
+        "feedback": data.get("feedback", {}),
+        "device": data.get("device", "unknown"),
+    }
+
+
+def rebuild_index():
+    """
+    Rewrite both session indexes from the session files themselves.
+
+    Not needed in normal use — missing rows are added automatically —
+    but it picks up session files that were edited by hand.
+    """
+    global _sessions_version, _quick_sessions_version
+    _ensure_dir()
+    _ensure_quick_dir()
+    for directory, summarize in (
+        (SESSIONS_DIR, _session_row),
+        (QUICK_SESSIONS_DIR, _quick_session_row),
+    ):
+        (directory / INDEX_FILENAME).unlink(missing_ok=True)
+        _indexed_rows(directory, summarize)
+    # Cached lists were built from the old index
+    with _cache_lock:
+        _sessions_version += 1
+        _quick_sessions_version += 1
 
 
 def generate_session_id() -> str:
@@ -43,47 +393,160 @@ def generate_session_id() -> str:
     - Human-readable (unlike UUIDs which look like gibberish)
     
     HOW THE COUNTER WORKS:
-    We look at existing files for today and find the highest counter,
-    then add 1. If no files exist for today, we start at 001.
+    See _next_counter — the first ID of the day looks at today's files
+    for the highest counter and adds 1 (001 if there are none); after
+    that it's the day's counter in .state/counters.json.
     """
     _ensure_dir()
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = date.today().isoformat()  # YYYY-MM-DD, without strftime parsing a format
+    return f"{today}_{_next_counter(SESSIONS_DIR, today, today):03d}"  # :03d pads to 3 digits
 
-    # Find existing sessions for today
-    existing = [
-        f.stem for f in SESSIONS_DIR.glob(f"{today}_*.json")
-    ]
 
-    if existing:
-        # Extract the counter part (after the last underscore)
-        counters = [int(name.split("_")[-1]) for name in existing]
-        next_counter = max(counters) + 1
-    else:
-        next_counter = 1
+# ──────────────────────────────────────────────
+# SESSION ID COUNTERS
+# ──────────────────────────────────────────────
+# WHY NOT JUST LOOK AT THE FILES EACH TIME:
+# That re-lists the directory for every new session, and it hands out
+# the same ID twice if a second session starts before the first one is
+# saved (session files are only written at the end). Instead, the last
+# counter issued per day is kept in .state/counters.json. The files are
+# only consulted when there's no counter for the day yet.
+#
+# WHY RE-READ IT UNDER A FILE LOCK:
+# With WEB_CONCURRENCY > 1 several worker processes issue IDs. A copy
+# of the counters in each process's memory would let two workers hand
+# out the same ID, and the second save would silently replace the
+# first. So every ID is read-increment-written while holding an OS
+# lock on .state/counters.lock (a threading.Lock only covers one
+# process). The lock is on a separate file because counters.json
+# itself is replaced, not rewritten in place, on every update.
+#
+# WHY A SUBDIRECTORY:
+# The counters are rewritten (temp file + rename) at every session
+# start. Doing that directly in sessions/ would change its mtime, and
+# the list and summary caches are keyed on that mtime — every new
+# session would throw them away. Renames inside .state/ only touch
+# .state/'s own mtime, and the *.json scans don't look inside it.
+
+STATE_DIRNAME = ".state"
+COUNTERS_FILENAME = "counters.json"
+COUNTERS_LOCK_FILENAME = "counters.lock"
+
+# Serializes threads within this process; the file lock does the rest
+_counters_lock = threading.Lock()
+
+
+def _next_counter(directory: Path, prefix: str, today: str) -> int:
+    """
+    The next counter for IDs like f"{prefix}_001" in directory.
+
+    today is the date in prefix (YYYY-MM-DD); counters for other days
+    are dropped, since their prefixes can't be issued again.
+    """
+    state_dir = SESSIONS_DIR / STATE_DIRNAME
+    _make_dir(state_dir)
+    with _counters_lock, _file_lock(state_dir / COUNTERS_LOCK_FILENAME):
+        counters = _stored_counters()
+        last = counters.get(prefix)
+        if last is None:
+            last = _highest_counter(directory, prefix)
+        last += 1
+        counters = {key: value for key, value in counters.items() if key.endswith(today)}
+        counters[prefix] = last
+        _write_json_atomic(_counters_path(), counters)
+        return last
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path):
+    """Hold an exclusive OS-level lock on path (created if missing)."""
+    with open(path, "a+b") as f:
+        _lock(f)
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+if os.name == "nt":
+    import msvcrt
+
+    # Windows locks byte ranges; byte 0 stands for the whole file
+
+    def _lock(f):
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # Retries ~10 s itself
+                return
+            except OSError:
+                continue
+
+    def _unlock(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
 
-    return f"{today}_{next_counter:03d}"  # :03d pads to 3 digits
+def _counters_path() -> Path:
+    """Where the counters are saved (SESSIONS_DIR can be repointed)."""
+    return SESSIONS_DIR / STATE_DIRNAME / COUNTERS_FILENAME
 
 
-def save_session(session_id: str, data: dict) -> str:
+def _stored_counters() -> dict[str, int]:
+    """The counters saved in the counters file, or {} if there are none."""
+    try:
+        return _read_json(_counters_path())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _highest_counter(directory: Path, prefix: str) -> int:
+    """Highest counter among directory's f"{prefix}_NNN.json" files; 0 if none."""
+    start = prefix + "_"
+    with os.scandir(directory) as it:
+        # Extract the counter part (after the last underscore)
+        counters = [
+            int(e.name[:-len(".json")].split("_")[-1])
+            for e in it
+            if e.name.startswith(start) and e.name.endswith(".json")
+        ]
+    return max(counters, default=0)
+
+
+def save_session(session_id: str, data: dict, pretty: bool = False) -> str:
     """
     Save a session to disk.
     
     Args:
         session_id: The session identifier (e.g. '2026-02-07_001')
         data: The complete session data dict
+        pretty: Indent the JSON (2 spaces) instead of writing it compact
     
     Returns:
         The file path where it was saved
     
-    WHY json.dumps WITH indent=2:
-    Pretty-printing makes the files human-readable. The tiny
-    extra disk space is worth it when you want to inspect a session
-    manually. sort_keys=False preserves insertion order.
+    WHY COMPACT BY DEFAULT:
+    The app is the only regular reader of these files, and indentation
+    makes a session roughly 40% bigger — more to write, more to read
+    back, more page cache. To look at one, run
+    `python session_store.py <session_id>`. Keys keep their insertion
+    order either way.
     """
+    global _sessions_version
     _ensure_dir()
     filepath = SESSIONS_DIR / f"{session_id}.json"
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _write_json_atomic(filepath, data, pretty)
+    _append_index(SESSIONS_DIR, [_session_row(session_id, data)])
+    with _cache_lock:
+        _sessions_version += 1  # Invalidates the cached lists and summaries
     return str(filepath)
 
 
@@ -95,54 +558,44 @@ def load_session(session_id: str) -> Optional[dict]:
     The caller can decide what to do — show a 404, create a new
     session, etc. Raising an exception here would force try/except
     everywhere this is called.
+
+    The result is cached and shared between callers (see _load_json),
+    so treat it as read-only.
     """
-    filepath = SESSIONS_DIR / f"{session_id}.json"
-    if not filepath.exists():
-        return None
-    with open(filepath) as f:
-        return json.load(f)
+    return _load_json(SESSIONS_DIR / f"{session_id}.json")
 
 
-def list_sessions() -> list[dict]:
+def list_sessions(limit: Optional[int] = None) -> list[dict]:
     """
     List all sessions with basic metadata.
     
     Returns a list of dicts with id, timestamp, domain, overall_score.
-    Sorted newest first.
+    Sorted newest first; only the newest `limit` if a limit is given.
     
     WHY NOT RETURN FULL SESSIONS:
     Full sessions can be large (all documents + notes + feedback).
     For the list view, we only need summary info. The frontend
     can request full details for a specific session if needed.
+
+    WHY SO LITTLE WORK:
+    The rows come from the session index (see SESSION INDEX above), so
+    listing reads one file instead of parsing every session. And if
+    nothing in the directory changed at all (same save count, same
+    directory mtime), the previous list is returned without even that.
     """
     _ensure_dir()
-    sessions = []
+    with _cache_lock:
+        cache_key = (_sessions_version, SESSIONS_DIR.stat().st_mtime_ns)
+        if _sessions_list_cache["key"] == cache_key:
+            return _sessions_list_cache["sessions"][:limit]
 
-    for filepath in sorted(SESSIONS_DIR.glob("*.json"), reverse=True):
-        try:
-            with open(filepath) as f:
-                data = json.load(f)
-            sessions.append({
-                "session_id": filepath.stem,
-                "timestamp": data.get("timestamp", ""),
-                "domain": data.get("domain", "unknown"),
-                "difficulty": data.get("difficulty", "unknown"),
-                "model_used": data.get("model_used", "unknown"),
-                "overall_score": (
-                    data.get("feedback", {})
-                    .get("overall", {})
-                    .get("score", None)
-                ),
-                "estimated_cost": (
-                    data.get("token_usage", {})
-                    .get("estimated_cost", None)
-                ),
-            })
-        except (json.JSONDecodeError, KeyError):
-            # Skip corrupted files
-            continue
-
-    return sessions
+    # The full list is cached (it's one index read), and sliced per call
+    sessions = _indexed_rows(SESSIONS_DIR, _session_row)
+    with _cache_lock:
+        if _sessions_version == cache_key[0]:  # No save while we were reading
+            _sessions_list_cache["key"] = cache_key
+            _sessions_list_cache["sessions"] = sessions
+    return sessions[:limit]
 
 
 def get_past_summaries(limit: int = 5) -> list[dict]:
@@ -156,29 +609,54 @@ def get_past_summaries(limit: int = 5) -> list[dict]:
     
     Args:
         limit: Maximum number of past sessions to include
+
+    WHY CACHED:
+    Every review calls this, and the answer only changes when a session
+    is saved. We remember the result per limit and throw it away when
+    save_session bumps _sessions_version (or the directory's mtime
+    changes, which catches files added or removed by hand).
     """
     _ensure_dir()
-    summaries = []
+    with _cache_lock:
+        cache_key = (_sessions_version, SESSIONS_DIR.stat().st_mtime_ns)
+        if _summaries_cache["key"] != cache_key:
+            _summaries_cache["key"] = cache_key
+            _summaries_cache["by_limit"] = {}
+        cached = _summaries_cache["by_limit"].get(limit)
+    if cached is not None:
+        return list(cached)
 
-    for filepath in sorted(SESSIONS_DIR.glob("*.json"), reverse=True):
+    summaries = []
+    session_ids = _session_ids(SESSIONS_DIR)
+
+    # Read `limit` files at a time, newest first; usually the first
+    # batch is enough, unless some sessions were never reviewed
+    for start in range(0, len(session_ids), max(limit, 1)):
+        batch = session_ids[start:start + max(limit, 1)]
+        for session_id, data in zip(batch, _scan_sessions(SESSIONS_DIR, batch)):
+            if data is None:
+                continue
+            try:
+                feedback = data.get("feedback", {})
+                overall = feedback.get("overall", {})
+                if overall:  # Only include completed sessions
+                    summaries.append({
+                        "session_id": session_id,
+                        "overall_score": overall.get("score"),
+                        "summary": overall.get("summary", ""),
+                        "top_improvement": overall.get("top_improvement", ""),
+                    })
+            except KeyError:
+                continue
         if len(summaries) >= limit:
             break
-        try:
-            with open(filepath) as f:
-                data = json.load(f)
-            feedback = data.get("feedback", {})
-            overall = feedback.get("overall", {})
-            if overall:  # Only include completed sessions
-                summaries.append({
-                    "session_id": filepath.stem,
-                    "overall_score": overall.get("score"),
-                    "summary": overall.get("summary", ""),
-                    "top_improvement": overall.get("top_improvement", ""),
-                })
-        except (json.JSONDecodeError, KeyError):
-            continue
+    summaries = summaries[:limit]
 
-    return summaries
+    with _cache_lock:
+        # Only if no save (or other change) replaced the key meanwhile
+        if _summaries_cache["key"] == cache_key and _sessions_version == cache_key[0]:
+            _summaries_cache["by_limit"][limit] = summaries
+    return list(summaries)
 
 
 # ──────────────────────────────────────────────
@@ -192,64 +670,73 @@ QUICK_SESSIONS_DIR = Path(__file__).parent.parent / "sessions" / "quick"
 
 def _ensure_quick_dir():
     """Create the quick sessions directory if it doesn't exist."""
-    QUICK_SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+    _make_dir(QUICK_SESSIONS_DIR)
 
 
 def generate_quick_session_id() -> str:
     """Create a unique quick session ID like 'quick_2026-02-07_001'."""
     _ensure_quick_dir()
-    today = datetime.now().strftime("%Y-%m-%d")
-
-    existing = [
-        f.stem for f in QUICK_SESSIONS_DIR.glob(f"quick_{today}_*.json")
-    ]
+    today = date.today().isoformat()
+    return f"quick_{today}_{_next_counter(QUICK_SESSIONS_DIR, f'quick_{today}', today):03d}"
 
-    if existing:
-        counters = [int(name.split("_")[-1]) for name in existing]
-        next_counter = max(counters) + 1
-    else:
-        next_counter = 1
 
-    return f"quick_{today}_{next_counter:03d}"
+# Bumped by every save_quick_session, like _sessions_version
+_quick_sessions_version = 0
 
 
-def save_quick_session(session_id: str, data: dict) -> str:
-    """Save a quick practice session."""
+def save_quick_session(session_id: str, data: dict, pretty: bool = False) -> str:
+    """Save a quick practice session (compact unless pretty; see save_session)."""
+    global _quick_sessions_version
     _ensure_quick_dir()
     filepath = QUICK_SESSIONS_DIR / f"{session_id}.json"
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _write_json_atomic(filepath, data, pretty)
+    _append_index(QUICK_SESSIONS_DIR, [_quick_session_row(session_id, data)])
+    with _cache_lock:
+        _quick_sessions_version += 1  # Invalidates the list_quick_sessions cache
     return str(filepath)
 
 
 def load_quick_session(session_id: str) -> Optional[dict]:
-    """Load a quick practice session."""
-    filepath = QUICK_SESSIONS_DIR / f"{session_id}.json"
-    if not filepath.exists():
-        return None
-    with open(filepath) as f:
-        return json.load(f)
+    """Load a quick practice session (cached and shared, like load_session)."""
+    return _load_json(QUICK_SESSIONS_DIR / f"{session_id}.json")
 
 
 def list_quick_sessions() -> list[dict]:
-    """List all quick practice sessions, newest first."""
-    _ensure_quick_dir()
-    sessions = []
-
-    for filepath in sorted(QUICK_SESSIONS_DIR.glob("*.json"), reverse=True):
-        try:
-            with open(filepath) as f:
-                data = json.load(f)
-            sessions.append({
-                "session_id": filepath.stem,
-                "timestamp": data.get("timestamp", ""),
-                "duration_mode": data.get("duration_mode", "unknown"),
-                "question": data.get("question", ""),
-                "user_response": data.get("user_response", ""),
-                "feedback": data.get("feedback", {}),
-                "device": data.get("device", "unknown"),
-            })
-        except (json.JSONDecodeError, KeyError):
-            continue
+    """
+    List all quick practice sessions, newest first.
 
-    return sessions
+    Read from the quick sessions' own index and cached until a quick
+    session is saved or the directory changes, like list_sessions.
+    """
+    _ensure_quick_dir()
+    with _cache_lock:
+        cache_key = (_quick_sessions_version, QUICK_SESSIONS_DIR.stat().st_mtime_ns)
+        if _quick_list_cache["key"] == cache_key:
+            return list(_quick_list_cache["sessions"])
+
+    sessions = _indexed_rows(QUICK_SESSIONS_DIR, _quick_session_row)
+    with _cache_lock:
+        if _quick_sessions_version == cache_key[0]:  # No save while we were reading
+            _quick_list_cache["key"] = cache_key
+            _quick_list_cache["sessions"] = sessions
+    return list(sessions)
+
+
+def pretty_print(session_id: str) -> str:
+    """A saved session (full or quick) as indented JSON, for reading."""
+    data = load_quick_session(session_id) if session_id.startswith("quick_") else load_session(session_id)
+    if data is None:
+        raise FileNotFoundError(f"No saved session {session_id!r}")
+    return _dump_json(data, pretty=True).decode("utf-8")
+
+
+if __name__ == "__main__":
+    # python session_store.py 2026-02-07_001
+    import sys
+
+    if len(sys.argv) != 2:
+        sys.exit("usage: python session_store.py <session_id>")
+    try:
+        print(pretty_print(sys.argv[1]), end="")
+    except FileNotFoundError as e:
+        sys.exit(str(e))
@@ -0,0 +1,106 @@
+"""
+Static file serving for the built frontend, with caching and precompression.
+
+WHY NOT PLAIN StaticFiles:
+StaticFiles sends every file uncompressed and without cache headers, so
+the browser re-fetches the whole JS bundle on every visit. Two things
+fix that:
+
+  1. CACHE HEADERS — Vite puts everything it builds under assets/ with a
+     content hash in the name (index-3f9a1c.js). A changed file gets a
+     new name, so those can be cached "forever". index.html is not
+     hashed and must be revalidated every time, or users would keep
+     loading an old bundle after a deploy.
+
+  2. PRECOMPRESSED FILES — if the build step left index-3f9a1c.js.br or
+     .gz next to the original, and the browser accepts that encoding,
+     we send the compressed file as-is. Nothing is compressed per
+     request. Files without a compressed twin are served normally.
+     Every hashed-asset response carries Vary: Accept-Encoding, since
+     any of them could have been the compressed variant.
+"""
+
+import stat
+from mimetypes import guess_type
+
+import anyio
+from fastapi.responses import FileResponse
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+
+# Vite's output directory for hashed build artifacts (relative to dist/)
+HASHED_ASSETS_PREFIX = "assets/"
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# Preferred first
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """
+    The encodings an Accept-Encoding header allows, lowercased.
+
+    WHY PARSE (AND NOT JUST `"br" in header`):
+    "br;q=0" means "never send Brotli", and a substring test would also
+    match tokens that merely contain "br" or "gzip". Tokens with q=0
+    are left out. "*" stands for every encoding not listed by name, so
+    it's expanded against PRECOMPRESSED.
+    """
+    weights = {}
+    for part in header.split(","):
+        token, _, params = part.partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0  # Malformed weight: don't guess in favour of it
+        weights[token] = q
+    accepted = {token for token, q in weights.items() if q > 0}
+    if "*" in accepted:
+        accepted.update(enc for enc, _ in PRECOMPRESSED if enc not in weights)
+    return accepted
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that sets Cache-Control and serves .br/.gz twins when it can."""
+
+    async def get_response(self, path: str, scope):
+        hashed = path.startswith(HASHED_ASSETS_PREFIX)
+
+        response = await self._precompressed_response(path, scope) if hashed else None
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = IMMUTABLE if hashed else REVALIDATE
+        if hashed:
+            # Caches must key copies (and 304s) on the encoding, whichever we sent
+            response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    async def _precompressed_response(self, path: str, scope):
+        """A FileResponse for path's .br/.gz twin, or None if there isn't a usable one."""
+        accepted = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        for encoding, suffix in PRECOMPRESSED:
+            if encoding not in accepted:
+                continue
+            full_path, stat_result = await anyio.to_thread.run_sync(
+                self.lookup_path, path + suffix
+            )
+            if stat_result and stat.S_ISREG(stat_result.st_mode):
+                return FileResponse(
+                    full_path,
+                    stat_result=stat_result,
+                    # Content-Type of the original file, not of the .br
+                    media_type=guess_type(path)[0] or "text/plain",
+                    headers={"Content-Encoding": encoding},
+                )
+        return None
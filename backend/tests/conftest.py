@@ -0,0 +1,10 @@
+"""
+The backend modules import each other as top-level modules
+(`import schemas`, `from config import ...`), the way uvicorn runs them
+from backend/. Put backend/ on the path so the tests can do the same.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
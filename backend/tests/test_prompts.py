@@ -0,0 +1,30 @@
+"""
+System prompts: the shared JSON instruction and the output_format examples.
+"""
+
+import pytest
+
+from claude_client import CALLS
+from prompts import _JSON_ONLY, JSON_REPAIR_SYSTEM_PROMPT
+
+
+def test_json_instruction_is_a_complete_sentence():
+    assert _JSON_ONLY.startswith("Return ONLY valid JSON")
+    assert _JSON_ONLY.endswith(".")
+
+
+@pytest.mark.parametrize("name", CALLS)
+def test_prompt_carries_the_json_instruction(name):
+    assert _JSON_ONLY + " Use " in CALLS[name].system
+
+
+def test_repair_prompt_carries_the_json_instruction():
+    assert _JSON_ONLY + " Keep the structure of the input." in JSON_REPAIR_SYSTEM_PROMPT
+
+
+@pytest.mark.parametrize("name", CALLS)
+def test_example_names_every_schema_key(name):
+    # The example is minified, so each key appears as "key": with no space
+    spec = CALLS[name]
+    for key in spec.schema.__annotations__:
+        assert f'"{key}":' in spec.system, key
@@ -0,0 +1,35 @@
+"""
+The exact-match response cache hands out independent copies.
+"""
+
+from claude_client import _RESPONSE_CACHE, _cache_get, _cache_put
+from config import MODELS
+from token_tracker import TokenTracker
+
+MODEL = next(iter(MODELS.values()))
+
+
+def test_hits_are_independent_of_the_stored_result():
+    result = {"captured": ["a"], "missed": [], "feedback": "ok"}
+    _cache_put("k", result)
+    result["captured"].append("changed by the first caller")
+
+    hit = _cache_get("k", TokenTracker(), MODEL, "checklist_review")
+    assert hit == {"captured": ["a"], "missed": [], "feedback": "ok"}
+    hit["missed"].append("changed by the second caller")
+    assert _cache_get("k", TokenTracker(), MODEL, "checklist_review")["missed"] == []
+    _RESPONSE_CACHE.pop("k")
+
+
+def test_hit_is_tracked_as_a_free_call():
+    _cache_put("k2", {"score": 4})
+    tracker = TokenTracker()
+    assert _cache_get("k2", tracker, MODEL, "quick_grade") == {"score": 4}
+    assert tracker.call_count == 1 and tracker.accumulated_cost == 0
+    assert tracker.calls[0]["label"] == "quick_grade (cached)"
+    _RESPONSE_CACHE.pop("k2")
+
+
+def test_errors_are_not_cached():
+    _cache_put("k3", {"error": "Failed to parse JSON response"})
+    assert _cache_get("k3", TokenTracker(), MODEL, "x") is None
@@ -0,0 +1,79 @@
+"""
+The combined review + comparison call (review_with_comparison).
+
+The comparison is best-effort: whatever Claude does with "improvement",
+the user's feedback must come through.
+"""
+
+from types import SimpleNamespace
+
+import orjson
+
+import schemas
+from claude_client import _parse_response, _split_review_and_comparison
+from config import MODELS
+from token_tracker import TokenTracker
+
+SCORED = {"score": 4, "feedback": "Good."}
+DOC = {"found": ["a"], "missed": [], "feedback": "Fine."}
+
+FEEDBACK = {
+    "deliverable_understanding": SCORED,
+    "note_quality": SCORED,
+    "note_efficiency": SCORED,
+    "concept_extraction": {"doc1": DOC, "doc2": DOC, "doc3": DOC},
+    "data_predictions": {
+        "score": 3, "correct_predictions": [], "missed_predictions": [], "feedback": "Ok.",
+    },
+    "data_analysis": {
+        "score": 3, "correct_observations": [], "missed_observations": [], "feedback": "Ok.",
+    },
+    "formatting": SCORED,
+    "overall": {"score": 4, "summary": "Solid.", "top_improvement": "Be faster."},
+}
+
+IMPROVEMENT = {
+    "improvements": ["Clearer bullets"],
+    "persistent_issues": [],
+    "new_strengths": [],
+    "overall_trend": "improving",
+    "recommendation": "Keep going.",
+}
+
+
+def _review(body: dict) -> dict:
+    """Parse body as if Claude had answered the combined call with it."""
+    response = SimpleNamespace(
+        usage=SimpleNamespace(input_tokens=10, output_tokens=10),
+        content=[SimpleNamespace(text=orjson.dumps(body).decode())],
+        stop_reason="end_turn",
+    )
+    parsed = _parse_response(
+        response, TokenTracker(), next(iter(MODELS.values())),
+        "review_with_comparison", schemas.ReviewWithComparisonResponse,
+    )
+    return _split_review_and_comparison(parsed)
+
+
+def test_valid_comparison_is_kept():
+    result = _review({"feedback": FEEDBACK, "improvement": IMPROVEMENT})
+    assert result == {"feedback": FEEDBACK, "improvement": IMPROVEMENT}
+
+
+def test_missing_comparison_keeps_feedback():
+    result = _review({"feedback": FEEDBACK})
+    assert result == {"feedback": FEEDBACK, "improvement": None}
+
+
+def test_malformed_comparison_keeps_feedback():
+    bad = {**IMPROVEMENT, "improvements": "not a list"}
+    del bad["recommendation"]
+    for improvement in (bad, "better than last time", [IMPROVEMENT]):
+        result = _review({"feedback": FEEDBACK, "improvement": improvement})
+        assert result == {"feedback": FEEDBACK, "improvement": None}
+
+
+def test_malformed_feedback_is_still_an_error():
+    result = _review({"feedback": {"overall": {}}, "improvement": IMPROVEMENT})
+    assert "error" in result["feedback"]
+    assert result["improvement"] is None
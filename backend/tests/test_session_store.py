@@ -0,0 +1,59 @@
+"""
+session_store: cached lists and summaries stay in step with saves.
+"""
+
+import pytest
+
+import session_store
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_store, "SESSIONS_DIR", tmp_path)
+    monkeypatch.setattr(session_store, "QUICK_SESSIONS_DIR", tmp_path / "quick")
+    return session_store
+
+
+def _reviewed(score):
+    return {"feedback": {"overall": {"score": score, "summary": "s", "top_improvement": "t"}}}
+
+
+def _save_during(store, monkeypatch, name, save):
+    """Run save() in the middle of the next call to store.<name>."""
+    original = getattr(store, name)
+
+    def racing(*args):
+        result = original(*args)
+        monkeypatch.setattr(store, name, original)
+        save()
+        return result
+
+    monkeypatch.setattr(store, name, racing)
+
+
+def test_list_built_before_a_save_is_not_cached(store, monkeypatch):
+    store.save_session("2026-01-01_001", _reviewed(3))
+    _save_during(store, monkeypatch, "_indexed_rows",
+                 lambda: store.save_session("2026-01-01_002", _reviewed(4)))
+    assert len(store.list_sessions()) == 1  # Built just before the save
+    assert len(store.list_sessions()) == 2
+
+
+def test_quick_list_built_before_a_save_is_not_cached(store, monkeypatch):
+    store.save_quick_session("quick_2026-01-01_001", {})
+    _save_during(store, monkeypatch, "_indexed_rows",
+                 lambda: store.save_quick_session("quick_2026-01-01_002", {}))
+    assert len(store.list_quick_sessions()) == 1
+    assert len(store.list_quick_sessions()) == 2
+
+
+def test_summaries_built_before_a_save_are_not_cached(store, monkeypatch):
+    store.save_session("2026-01-01_001", _reviewed(3))
+
+    def save_and_reread():
+        store.save_session("2026-01-01_002", _reviewed(4))
+        store.get_past_summaries(1)  # Resets the cache for the new version
+
+    _save_during(store, monkeypatch, "_scan_sessions", save_and_reread)
+    assert [s["overall_score"] for s in store.get_past_summaries(5)] == [3]
+    assert [s["overall_score"] for s in store.get_past_summaries(5)] == [4, 3]
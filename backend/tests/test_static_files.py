@@ -0,0 +1,60 @@
+"""
+CachedStaticFiles: cache headers and precompressed variants.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from static_files import CachedStaticFiles, _accepted_encodings
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("", set()),
+    ("gzip, deflate, br", {"gzip", "deflate", "br"}),
+    ("br;q=0, gzip", {"gzip"}),
+    ("BR ; Q=0.5, gzip;q=0", {"br"}),
+    ("x-gzip-ish, brotli", {"x-gzip-ish", "brotli"}),
+    ("*", {"*", "br", "gzip"}),
+    ("*;q=0.1, br;q=0", {"*", "gzip"}),
+    ("br;q=abc", set()),
+])
+def test_accepted_encodings(header, expected):
+    assert _accepted_encodings(header) == expected
+
+
+@pytest.fixture
+def client(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "app-1a2b.js").write_text("console.log(1)")
+    (tmp_path / "assets" / "app-1a2b.js.br").write_bytes(b"brotli bytes")
+    (tmp_path / "index.html").write_text("<html></html>")
+    app = FastAPI()
+    app.mount("/", CachedStaticFiles(directory=tmp_path, html=True))
+    return TestClient(app)
+
+
+def _get(client, encoding):
+    return client.get("/assets/app-1a2b.js", headers={"Accept-Encoding": encoding})
+
+
+def test_serves_brotli_when_accepted(client):
+    response = _get(client, "gzip, br")
+    # Headers only — the body isn't real Brotli, so it can't be decoded
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["content-type"].startswith("text/javascript")
+
+
+@pytest.mark.parametrize("encoding", ["br;q=0, gzip", "brotli", "identity"])
+def test_serves_original_otherwise(client, encoding):
+    response = _get(client, encoding)
+    assert "content-encoding" not in response.headers
+    assert response.text == "console.log(1)"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["cache-control"].startswith("public, max-age=31536000")
+
+
+def test_index_is_revalidated(client):
+    response = client.get("/")
+    assert response.headers["cache-control"] == "no-cache"
@@ -0,0 +1,88 @@
+"""
+stream_async: the concurrency permit covers the upstream request only.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+import claude_client
+from claude_client import _CALL_SEMAPHORE, _MAX_CONCURRENT_CALLS, stream_async
+from token_tracker import TokenTracker
+
+REVIEW = {"captured": ["flow limit"], "missed": [], "feedback": "Good."}
+CHECKLIST_ARGS = {
+    "document": {"title": "Pump manual", "content": "Max flow 40 L/s."},
+    "checklist": [{"parameter": "Max flow", "value": "40 L/s"}],
+    "rubric_key_concepts": ["flow limit"],
+}
+
+
+class _FakeStream:
+    """Just enough of the SDK's MessageStream for stream_async."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self._chunks:
+            await asyncio.sleep(0)
+            yield chunk
+
+    async def get_final_message(self):
+        return SimpleNamespace(
+            usage=SimpleNamespace(input_tokens=1, output_tokens=1),
+            content=[SimpleNamespace(text="".join(self._chunks))],
+            stop_reason="end_turn",
+        )
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    text = orjson.dumps(REVIEW).decode()
+    chunks = [text[i:i + 5] for i in range(0, len(text), 5)]
+    client = SimpleNamespace(messages=SimpleNamespace(stream=lambda **_: _FakeStream(chunks)))
+    monkeypatch.setattr(claude_client, "_get_async_client", lambda: client)
+    return chunks
+
+
+def test_yields_text_then_result(fake_client):
+    async def main():
+        return [item async for item in stream_async("checklist", TokenTracker(), **CHECKLIST_ARGS)]
+
+    items = asyncio.run(main())
+    assert [value for kind, value in items if kind == "text"] == fake_client
+    assert items[-1] == ("result", REVIEW)
+
+
+def test_suspended_consumer_holds_no_permit(fake_client):
+    async def main():
+        stream = stream_async("checklist", TokenTracker(), **CHECKLIST_ARGS)
+        await stream.__anext__()  # First chunk, then the consumer stalls
+        for _ in range(10 * len(fake_client)):
+            await asyncio.sleep(0)  # Let the upstream read finish
+        free = _CALL_SEMAPHORE._value
+        await stream.aclose()
+        return free
+
+    assert asyncio.run(main()) == _MAX_CONCURRENT_CALLS
+
+
+def test_abandoned_stream_releases_its_permit(fake_client):
+    async def main():
+        stream = stream_async("checklist", TokenTracker(), **CHECKLIST_ARGS)
+        await stream.__anext__()
+        await stream.aclose()  # Client disconnected mid-stream
+        await asyncio.sleep(0)
+        return _CALL_SEMAPHORE._value
+
+    assert asyncio.run(main()) == _MAX_CONCURRENT_CALLS
@@ -0,0 +1,45 @@
+"""
+_TopLevelSections: completed top-level values out of a streamed object.
+"""
+
+import orjson
+import pytest
+
+from claude_client import _TopLevelSections
+
+SCENARIO = {
+    "background": {"title": "Cooling {towers}", "content": 'He said "hi" \\ [ok]'},
+    "note": "a top-level string, not a key",
+    "request": {"from": "A", "subject": "B", "body": "C"},
+    "count": 3,
+    "documents": [{"title": "D1", "content": "x" * 5000}, {"title": "D2", "content": "y"}],
+}
+
+
+def _sections(text: str, size: int) -> list:
+    scanner = _TopLevelSections()
+    done = []
+    for i in range(0, len(text), size):
+        done += scanner.feed(text[i:i + size])
+    return done
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 100_000])
+def test_reports_each_container_value_once(size):
+    text = "```json\n" + orjson.dumps(SCENARIO, option=orjson.OPT_INDENT_2).decode()
+    assert _sections(text, size) == [
+        ("background", SCENARIO["background"]),
+        ("request", SCENARIO["request"]),
+        ("documents", SCENARIO["documents"]),
+    ]
+
+
+def test_string_value_before_an_object_is_not_a_key():
+    assert _sections('{"a": "b", "c": {"d": 1}}', 1) == [("c", {"d": 1})]
+
+
+def test_drops_text_once_nothing_is_pending():
+    scanner = _TopLevelSections()
+    scanner.feed('{"a": [1, 2')
+    scanner.feed("]")
+    assert scanner._parts == []
@@ -8,15 +8,16 @@ see their running cost and we can enforce the budget limit.
 
 HOW IT WORKS:
 Each session gets a TokenTracker instance. After every API call,
-we call track() with the usage data from the response. The tracker
-accumulates totals and can estimate cost at any time.
+we call track() with the usage data from the response and the model
+that served it. The tracker keeps a running dollar total, so checking
+the cost at any time is just reading a number.
 """
 
 from dataclasses import dataclass, field
 from config import ModelConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenTracker:
     """
     Accumulates token usage across multiple API calls in a session.
@@ -29,50 +30,82 @@ class TokenTracker:
     """
     total_input_tokens: int = 0
     total_output_tokens: int = 0
+    # Prompt-cache tokens are reported separately from input_tokens
+    # and priced differently (see ModelConfig)
+    total_cache_write_tokens: int = 0
+    total_cache_read_tokens: int = 0
     call_count: int = 0
 
+    # Running cost in dollars, updated by every track() call.
+    # WHY RUNNING: the budget is checked before every API call; keeping
+    # the total up to date means that check never has to recompute.
+    # It also prices each call with the model that actually served it,
+    # even if the model is changed mid-session.
+    accumulated_cost: float = 0.0
+
     # We store per-call breakdowns for debugging/display
     calls: list = field(default_factory=list)
 
-    def track(self, input_tokens: int, output_tokens: int, call_label: str = ""):
+    def track(
+        self,
+        model: ModelConfig,
+        input_tokens: int,
+        output_tokens: int,
+        call_label: str = "",
+        cache_write_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        cache_write_1h_tokens: int = 0,
+    ):
         """
         Record tokens from one API call.
         
         Args:
+            model: The model that served the call (for pricing)
             input_tokens: Number of input tokens (from response.usage.input_tokens)
             output_tokens: Number of output tokens (from response.usage.output_tokens)
             call_label: Human-readable label like "scenario_generation"
+            cache_write_tokens: Tokens written to the prompt cache
+                (response.usage.cache_creation_input_tokens)
+            cache_read_tokens: Tokens served from the prompt cache
+                (response.usage.cache_read_input_tokens)
+            cache_write_1h_tokens: How many of cache_write_tokens were
+                written with the 1-hour TTL (priced higher than 5-minute)
         """
         self.total_input_tokens += input_tokens
         self.total_output_tokens += output_tokens
+        self.total_cache_write_tokens += cache_write_tokens
+        self.total_cache_read_tokens += cache_read_tokens
+        # Prices are per token (ModelConfig precomputes them from the
+        # per-million list prices: $15/M input = $0.000015 per token)
+        self.accumulated_cost += (
+            input_tokens * model.input_cost_per_tok
+            + output_tokens * model.output_cost_per_tok
+            + (cache_write_tokens - cache_write_1h_tokens) * model.cache_write_cost_per_tok
+            + cache_write_1h_tokens * model.cache_write_1h_cost_per_tok
+            + cache_read_tokens * model.cache_read_cost_per_tok
+        )
         self.call_count += 1
         self.calls.append({
             "label": call_label,
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
+            "cache_write_tokens": cache_write_tokens,
+            "cache_read_tokens": cache_read_tokens,
         })
 
-    def estimate_cost(self, model: ModelConfig) -> float:
-        """
-        Calculate estimated cost in dollars.
-        
-        WHY THE DIVISION BY 1_000_000:
-        Pricing is per million tokens. So if you used 15,000 input tokens
-        at $15/M, that's 15000 / 1000000 * 15 = $0.225
-        
-        Python lets you use underscores in numbers for readability:
-        1_000_000 == 1000000 but is much easier to read.
-        """
-        input_cost = (self.total_input_tokens / 1_000_000) * model.input_cost_per_m
-        output_cost = (self.total_output_tokens / 1_000_000) * model.output_cost_per_m
-        return round(input_cost + output_cost, 4)
+    def estimate_cost(self) -> float:
+        """Estimated cost so far in dollars (see track() for the math)."""
+        return round(self.accumulated_cost, 4)
 
-    def to_dict(self, model: ModelConfig) -> dict:
+    def to_dict(self) -> dict:
         """Serialize for JSON storage and API responses."""
         return {
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
+            "total_cache_write_tokens": self.total_cache_write_tokens,
+            "total_cache_read_tokens": self.total_cache_read_tokens,
             "call_count": self.call_count,
             "calls": self.calls,
-            "estimated_cost": self.estimate_cost(model),
+            "estimated_cost": self.estimate_cost(),
         }
+